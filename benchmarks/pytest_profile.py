@@ -0,0 +1,81 @@
+"""Compare a bare pytest invocation with torchlings' trimmed profile.
+
+Usage (with torchlings installed, after `torchlings init`):
+
+    python benchmarks/pytest_profile.py -e exercises -x 01_tensors/1.py -n 10
+
+Both variants run the same exercise with the workspace venv, alternating so
+that disk caches and CPU frequency affect them equally.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+from torchlings.runner import PYTEST_ARGS
+from torchlings.workspace import (
+    install_runtime,
+    pytest_profile_args,
+    pytest_profile_env,
+    thread_budget,
+    thread_env,
+    venv_python,
+)
+
+
+def _time_run(cmd: list[str], env: dict[str, str], cwd: Path) -> float:
+    start = time.perf_counter()
+    subprocess.run(cmd, env=env, cwd=cwd, capture_output=True, text=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-e", "--exercises-path", type=Path, default=Path("exercises"))
+    parser.add_argument("-x", "--exercise", default="01_tensors/1.py")
+    parser.add_argument("-n", "--runs", type=int, default=10)
+    parser.add_argument("-t", "--threads", type=int, default=thread_budget())
+    args = parser.parse_args()
+
+    workspace = args.exercises_path.resolve()
+    target = str(workspace / args.exercise)
+    python = str(venv_python(workspace))
+    install_runtime(workspace)
+
+    bare_env = os.environ.copy()
+    bare_env.update(thread_env(args.threads))
+    trimmed_env = bare_env.copy()
+    trimmed_env.update(pytest_profile_env(workspace))
+    variants = {
+        "bare": ([python, "-m", "pytest", *PYTEST_ARGS, target], bare_env),
+        "trimmed": (
+            [python, "-m", "pytest", *PYTEST_ARGS, *pytest_profile_args(workspace), target],
+            trimmed_env,
+        ),
+    }
+
+    # One untimed run each so bytecode and the page cache are warm
+    for cmd, env in variants.values():
+        _time_run(cmd, env, workspace)
+
+    timings = {name: [] for name in variants}
+    for _ in range(args.runs):
+        for name, (cmd, env) in variants.items():
+            timings[name].append(_time_run(cmd, env, workspace))
+
+    print(f"{args.exercise}, {args.runs} runs each, {args.threads} threads per run")
+    for name, samples in timings.items():
+        print(
+            f"  {name:8s} median {statistics.median(samples) * 1000:7.1f} ms"
+            f"  min {min(samples) * 1000:7.1f} ms"
+        )
+    saved = statistics.median(timings["bare"]) - statistics.median(timings["trimmed"])
+    share = saved / statistics.median(timings["bare"]) * 100
+    print(f"  saved    {saved * 1000:7.1f} ms per run ({share:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""Measure how long torchlings takes to give feedback.
+
+Usage (with torchlings installed, after `torchlings init`):
+
+    python benchmarks/time_to_feedback.py -e exercises -o before.json
+    python benchmarks/time_to_feedback.py -e exercises -o after.json --compare before.json
+
+Three groups of measurements end up in the JSON file:
+
+* exercises: cold and warm time-to-feedback of Runner.run_pytest for every
+  exercise. The "fail" outcome runs the shipped stub; the "pass" outcome
+  runs the file of the same name from --solutions, when given. Cold runs
+  start without bytecode or torch.compile caches; warm runs repeat with
+  everything cached. The backend the runner picked is recorded; exercises
+  that would need Modal are skipped unless --modal is passed.
+* cli: startup latency of each CLI command (`<command> --help`).
+* parse: throughput of format_test_output on large synthetic pytest output.
+
+Exercise runs happen in a temporary copy of the workspace that shares its
+venv, so the real workspace's caches and progress are left alone.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib import resources
+from pathlib import Path
+
+import torchlings.exercises
+from torchlings.modal_runner import is_gpu_exercise, is_triton_exercise
+from torchlings.output import format_test_output
+from torchlings.runner import Runner
+from torchlings.venv import VENV_NAME
+from torchlings.workspace import HISTORY_FILE, STATE_DIR
+
+CLI_COMMANDS = [
+    ["--version"],
+    ["init", "--help"],
+    ["run", "--help"],
+    ["start", "--help"],
+    ["dashboard", "--help"],
+    ["best", "--help"],
+]
+
+
+def _median(samples: list[float]) -> float:
+    return round(statistics.median(samples), 4)
+
+
+def _last_backend(workspace: Path, history_lines: int) -> str:
+    """Backend of the newest run in the history, "precheck" if pytest never ran."""
+    path = workspace / STATE_DIR / HISTORY_FILE
+    lines = path.read_text().splitlines() if path.exists() else []
+    if len(lines) <= history_lines:
+        return "precheck"
+    return json.loads(lines[-1])["backend"]
+
+
+def _timed_run(runner: Runner, workspace: Path, target: Path) -> tuple[float, bool, str]:
+    """Time one run_pytest call with its output swallowed."""
+    history = workspace / STATE_DIR / HISTORY_FILE
+    before = len(history.read_text().splitlines()) if history.exists() else 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        passed = asyncio.run(runner.run_pytest(str(target)))
+        elapsed = time.perf_counter() - start
+    return elapsed, passed, _last_backend(workspace, before)
+
+
+def _clear_caches(workspace: Path, target: Path) -> None:
+    shutil.rmtree(target.parent / "__pycache__", ignore_errors=True)
+    shutil.rmtree(workspace / STATE_DIR / "cache", ignore_errors=True)
+
+
+def _needs_modal(runner: Runner, target: Path) -> bool:
+    if not is_gpu_exercise(str(target)) or runner._has_cuda():
+        return False
+    return not (is_triton_exercise(str(target)) and runner._has_triton())
+
+
+def bench_exercises(args) -> list[dict]:
+    source = args.exercises_path.resolve()
+    shipped = resources.files(torchlings.exercises)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="torchlings-bench-") as tmp:
+        workspace = Path(tmp)
+        if (source / VENV_NAME).exists():
+            (workspace / VENV_NAME).symlink_to(source / VENV_NAME)
+        sections = [p for p in shipped.iterdir() if p.is_dir()]
+        for section in sorted(sections, key=lambda p: p.name):
+            for file in sorted(section.iterdir(), key=lambda f: f.name):
+                if file.name.endswith(".py") and file.name != "__init__.py":
+                    (workspace / section.name).mkdir(exist_ok=True)
+                    (workspace / section.name / file.name).write_text(file.read_text())
+
+        # The runner resolves the venv relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(workspace)
+        try:
+            runner = Runner(workspace)
+            for target in runner.exercises:
+                name = str(target.relative_to(workspace))
+                if args.exercise and args.exercise not in name:
+                    continue
+                if _needs_modal(runner, target) and not args.modal:
+                    print(f"  {name}: skipped, needs Modal (pass --modal)")
+                    continue
+
+                outcomes = {"fail": target.read_text()}
+                if args.solutions and (args.solutions / name).exists():
+                    outcomes["pass"] = (args.solutions / name).read_text()
+                for outcome, code in outcomes.items():
+                    target.write_text(code)
+                    _clear_caches(workspace, target)
+                    runner._last_runs.clear()
+                    cold, passed, backend = _timed_run(runner, workspace, target)
+                    warm = []
+                    for _ in range(args.runs):
+                        runner._last_runs.clear()
+                        warm.append(_timed_run(runner, workspace, target)[0])
+                    entry = {
+                        "exercise": name,
+                        "outcome": outcome,
+                        "passed": passed,
+                        "backend": backend,
+                        "cold": round(cold, 4),
+                        "warm": _median(warm),
+                    }
+                    results.append(entry)
+                    print(
+                        f"  {name:24s} {outcome:4s} {backend:18s}"
+                        f" cold {cold:6.2f}s  warm {entry['warm']:6.2f}s"
+                        + ("" if passed == (outcome == "pass") else "  (unexpected outcome)")
+                    )
+                target.write_text(outcomes["fail"])
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def bench_cli(args) -> dict[str, float]:
+    results = {}
+    for command in CLI_COMMANDS:
+        samples = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-c", "from torchlings.cli import main; main()", *command],
+                capture_output=True,
+            )
+            samples.append(time.perf_counter() - start)
+        key = " ".join(command)
+        results[key] = _median(samples)
+        print(f"  torchlings {key:20s} {results[key] * 1000:7.1f} ms")
+    return results
+
+
+def synthetic_pytest_output(tests: int, fail_every: int = 5) -> str:
+    """Verbose pytest output for `tests` tests, every `fail_every`-th failing."""
+    lines = []
+    failed = []
+    for i in range(tests):
+        status = "FAILED" if i % fail_every == 0 else "PASSED"
+        if status == "FAILED":
+            failed.append(i)
+        lines.append(
+            f"exercises/01_tensors/1.py::test_case_{i} {status}"
+            f" [{(i + 1) * 100 // tests:3d}%]"
+        )
+    lines.append("")
+    lines.append("=" * 30 + " FAILURES " + "=" * 30)
+    for i in failed:
+        lines.append("_" * 20 + f" test_case_{i} " + "_" * 20)
+        lines.append(f"exercises/01_tensors/1.py:{i}: in test_case_{i}")
+        lines.append(f"    assert result.tolist() == expected_{i}")
+        lines.append(f"E   assert [1, 2, {i}] == [1, 2, 3]")
+        lines.append(f"E     At index 2 diff: {i} != 3")
+    lines.append("=" * 20 + f" {len(failed)} failed, {tests - len(failed)} passed " + "=" * 20)
+    return "\n".join(lines)
+
+
+def bench_parse(args) -> dict[str, dict]:
+    results = {}
+    for tests in args.parse_sizes:
+        stdout = synthetic_pytest_output(tests)
+        samples = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            format_test_output(stdout, "")
+            samples.append(time.perf_counter() - start)
+        seconds = _median(samples)
+        megabytes = len(stdout.encode()) / 1e6
+        results[str(tests)] = {
+            "seconds": seconds,
+            "mb_per_s": round(megabytes / seconds, 2) if seconds else None,
+        }
+        print(f"  {tests:6d} tests ({megabytes:5.2f} MB) {seconds * 1000:9.1f} ms")
+    return results
+
+
+def _metadata() -> dict:
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent,
+    ).stdout.strip()
+    return {
+        "commit": commit or None,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def _flatten(report: dict) -> dict[str, float]:
+    """Comparable "group/key" -> seconds pairs of a report."""
+    flat = {}
+    for entry in report.get("exercises", []):
+        for kind in ("cold", "warm"):
+            flat[f"exercises/{entry['exercise']}/{entry['outcome']}/{kind}"] = entry[kind]
+    for command, seconds in report.get("cli", {}).items():
+        flat[f"cli/{command}"] = seconds
+    for tests, entry in report.get("parse", {}).items():
+        flat[f"parse/{tests}"] = entry["seconds"]
+    return flat
+
+
+def compare(old: dict, new: dict) -> None:
+    before, after = _flatten(old), _flatten(new)
+    print(
+        f"\nCompared with {old['meta'].get('commit')} -> {new['meta'].get('commit')}"
+    )
+    for key in sorted(before.keys() & after.keys()):
+        a, b = before[key], after[key]
+        change = (b - a) / a * 100 if a else 0.0
+        print(f"  {key:48s} {a * 1000:9.1f} -> {b * 1000:9.1f} ms  {change:+6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-e", "--exercises-path", type=Path, default=Path("exercises"))
+    parser.add_argument("-x", "--exercise", help="only exercises whose path contains this")
+    parser.add_argument("-s", "--solutions", type=Path, help="solved exercises, same layout")
+    parser.add_argument("-n", "--runs", type=int, default=3)
+    parser.add_argument("-o", "--output", type=Path, default=Path("time_to_feedback.json"))
+    parser.add_argument("--compare", type=Path, help="earlier JSON report to compare with")
+    parser.add_argument("--modal", action="store_true", help="also run exercises on Modal")
+    parser.add_argument(
+        "--parse-sizes",
+        type=lambda s: [int(n) for n in s.split(",")],
+        default=[100, 1000, 3000],
+    )
+    parser.add_argument(
+        "--only",
+        choices=["exercises", "cli", "parse"],
+        action="append",
+        help="run only these groups (repeatable)",
+    )
+    args = parser.parse_args()
+    groups = args.only or ["exercises", "cli", "parse"]
+
+    report = {"meta": _metadata()}
+    if "exercises" in groups:
+        print("Exercises")
+        report["exercises"] = bench_exercises(args)
+    if "cli" in groups:
+        print("CLI startup")
+        report["cli"] = bench_cli(args)
+    if "parse" in groups:
+        print("format_test_output")
+        report["parse"] = bench_parse(args)
+
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"\nWrote {args.output}")
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), report)
+
+
+if __name__ == "__main__":
+    main()
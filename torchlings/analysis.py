@@ -0,0 +1,266 @@
+"""Static checks on exercise files that run without importing torch."""
+
+import ast
+import copy
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+STUB_MESSAGES = {
+    "returns_none": "returns None -- fill in the TODO",
+    "empty_function": "not implemented yet -- fill in the TODO",
+    "empty_class": "class not implemented yet -- fill in the TODO",
+}
+
+# Fingerprint key for everything at module level that isn't a definition
+MODULE_KEY = "<module>"
+
+
+@dataclass
+class Precheck:
+    """What can be said about an exercise before running it."""
+
+    syntax_error: str | None = None
+    # test name -> friendly reason it is bound to fail
+    doomed: dict[str, str] = field(default_factory=dict)
+    # tests that could plausibly pass and still need a real run
+    runnable: list[str] = field(default_factory=list)
+    # definition name -> hash of its AST, plus MODULE_KEY for the rest
+    fingerprints: dict[str, str] = field(default_factory=dict)
+    # test name -> every name it reads, directly or through other definitions
+    dependencies: dict[str, set[str]] = field(default_factory=dict)
+
+
+def precheck(path: str | Path) -> Precheck:
+    """Find syntax errors and tests that depend on untouched TODO stubs."""
+    try:
+        tree = ast.parse(Path(path).read_text(), filename=str(path))
+    except SyntaxError as e:
+        return Precheck(syntax_error=f"line {e.lineno}: {e.msg}")
+
+    definitions = top_level_definitions(tree)
+    stubs = {
+        name: kind
+        for name, node in definitions.items()
+        if (kind := stub_kind(node)) is not None
+    }
+    graph = {name: referenced_names(node) for name, node in definitions.items()}
+
+    result = Precheck(fingerprints=fingerprints(tree, definitions))
+    for name in definitions:
+        if not name.startswith("test_"):
+            continue
+        result.dependencies[name] = set().union(
+            *(graph[dep] for dep in [name, *dependencies(name, graph)])
+        )
+        blocking = [dep for dep in dependencies(name, graph) if dep in stubs]
+        if not blocking:
+            result.runnable.append(name)
+        elif blocking[0] == name[5:]:
+            result.doomed[name] = STUB_MESSAGES[stubs[blocking[0]]]
+        else:
+            result.doomed[name] = f"{blocking[0]} {STUB_MESSAGES[stubs[blocking[0]]]}"
+    return result
+
+
+def changed_tests(previous: dict[str, str], check: Precheck) -> set[str]:
+    """Tests affected by edits since the run that produced `previous`.
+
+    A test is affected when its own definition changed or it reads a name
+    whose definition was edited, added or removed. Changes outside any
+    definition (imports, constants) affect every test.
+    """
+    current = check.fingerprints
+    if previous.get(MODULE_KEY) != current.get(MODULE_KEY):
+        return set(check.dependencies)
+    changed = {
+        name
+        for name in previous.keys() | current.keys()
+        if previous.get(name) != current.get(name)
+    }
+    return {
+        test
+        for test, reads in check.dependencies.items()
+        if test in changed or not changed.isdisjoint(reads)
+    }
+
+
+def fingerprints(tree: ast.Module, definitions: dict[str, ast.AST]) -> dict[str, str]:
+    """Hash every definition's AST, and the module with definitions cut out.
+
+    ast.dump leaves out line numbers and comments, so moving code around or
+    editing comments doesn't count as a change.
+    """
+    prints = {name: _digest(node) for name, node in definitions.items()}
+    prints[MODULE_KEY] = _digest(_DefinitionStripper().visit(copy.deepcopy(tree)))
+    return prints
+
+
+class _DefinitionStripper(ast.NodeTransformer):
+    """Replace module-level definitions with their bare names."""
+
+    def _strip(self, node):
+        return ast.Expr(ast.Constant(node.name))
+
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_ClassDef = _strip
+
+
+def _digest(node: ast.AST) -> str:
+    return hashlib.sha1(ast.dump(node).encode()).hexdigest()
+
+
+def top_level_definitions(tree: ast.Module) -> dict[str, ast.AST]:
+    """Module-level functions and classes, including ones under if/try."""
+    definitions = {}
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            definitions[node.name] = node
+        elif isinstance(node, (ast.If, ast.Try, ast.With)):
+            pending[:0] = [
+                *node.body,
+                *getattr(node, "orelse", []),
+                *getattr(node, "finalbody", []),
+            ]
+    return definitions
+
+
+def referenced_names(node: ast.AST) -> set[str]:
+    """Every name a definition reads, including inside nested scopes."""
+    return {
+        n.id
+        for n in ast.walk(node)
+        if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)
+    }
+
+
+def dependencies(name: str, graph: dict[str, set[str]]) -> list[str]:
+    """Definitions reachable from `name`, nearest first."""
+    seen = {name}
+    order = []
+    queue = [name]
+    while queue:
+        current = queue.pop(0)
+        for dep in sorted(graph.get(current, ())):
+            if dep in graph and dep not in seen:
+                seen.add(dep)
+                order.append(dep)
+                queue.append(dep)
+    return order
+
+
+def stub_kind(node: ast.AST) -> str | None:
+    """Classify a definition that still looks like the shipped TODO stub."""
+    if isinstance(node, ast.ClassDef):
+        methods = [
+            n for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ]
+        if _is_empty(node.body) or (
+            methods and all(stub_kind(m) is not None for m in methods)
+        ):
+            return "empty_class"
+        return None
+    if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return None
+    if _is_empty(node.body):
+        return "empty_function"
+    returns = [n for n in _own_scope(node) if isinstance(n, ast.Return)]
+    if returns and all(_is_none(r.value, node) for r in returns):
+        return "returns_none"
+    return None
+
+
+def _is_empty(body: list[ast.stmt]) -> bool:
+    """True for a body that is only a docstring, pass and/or `...`."""
+    for stmt in body:
+        if isinstance(stmt, ast.Pass):
+            continue
+        if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant):
+            continue
+        return False
+    return True
+
+
+def _own_scope(func: ast.AST):
+    """Walk a function body without descending into nested scopes."""
+    pending = list(ast.iter_child_nodes(func))
+    while pending:
+        node = pending.pop()
+        yield node
+        if not isinstance(
+            node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+        ):
+            pending.extend(ast.iter_child_nodes(node))
+
+
+def _is_none(expr: ast.expr | None, func: ast.AST) -> bool:
+    """Whether a returned expression can only ever evaluate to None."""
+    if expr is None:
+        return True
+    if isinstance(expr, ast.Constant):
+        return expr.value is None
+    if isinstance(expr, ast.Tuple):
+        return all(_is_none(e, func) for e in expr.elts)
+    if isinstance(expr, ast.Name):
+        bindings = _bindings(expr.id, func)
+        return bool(bindings) and all(
+            isinstance(b, ast.Constant) and b.value is None for b in bindings
+        )
+    return False
+
+
+def _bindings(name: str, func: ast.AST) -> list[ast.AST]:
+    """Values bound to `name` in a function; other bindings add their node."""
+    args = func.args
+    params = [*args.posonlyargs, *args.args, *args.kwonlyargs, args.vararg, args.kwarg]
+    if any(p is not None and p.arg == name for p in params):
+        return [func]
+
+    bindings = []
+    handled = set()
+    for node in _own_scope(func):
+        if isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                bindings.extend(_assigned(name, target, node.value))
+                handled.update(id(n) for n in ast.walk(target))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if node.name == name:
+                bindings.append(node)
+        elif isinstance(node, ast.ExceptHandler) and node.name == name:
+            bindings.append(node)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if (alias.asname or alias.name.split(".")[0]) == name:
+                    bindings.append(node)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)) and name in node.names:
+            bindings.append(node)
+
+    # Anything else that stores to the name: for-loops, with-as, :=, +=, del
+    for node in _own_scope(func):
+        if (
+            isinstance(node, ast.Name)
+            and node.id == name
+            and isinstance(node.ctx, (ast.Store, ast.Del))
+            and id(node) not in handled
+        ):
+            bindings.append(node)
+    return bindings
+
+
+def _assigned(name: str, target: ast.expr, value: ast.expr) -> list[ast.AST]:
+    """Values a plain assignment binds to `name`, unpacking literal tuples."""
+    if isinstance(target, ast.Name):
+        return [value] if target.id == name else []
+    if isinstance(target, (ast.Tuple, ast.List)) and isinstance(
+        value, (ast.Tuple, ast.List)
+    ):
+        if len(value.elts) == len(target.elts):
+            return [
+                b for t, v in zip(target.elts, value.elts) for b in _assigned(name, t, v)
+            ]
+    # Starred, subscript or non-literal unpacking: bound to something unknown
+    if any(isinstance(n, ast.Name) and n.id == name for n in ast.walk(target)):
+        return [target]
+    return []
@@ -2,10 +2,18 @@ from pathlib import Path
 from importlib.metadata import version as pkg_version
 from torchlings.pretty import print_banner, print_welcome_message
 from torchlings.venv import setup_python_environment
+from torchlings.output import format_bests
+from torchlings.workspace import (
+    install_runtime,
+    load_bests,
+    precompile_workspace,
+    warm_compile_cache,
+)
 import click
 from importlib import resources
 import shutil
 from torchlings.runner import Runner
+from torchlings.dashboard import Dashboard
 
 
 @click.group(
@@ -31,10 +39,16 @@ def cli():
     show_default=True,
     help="Path to exercises directory",
 )
-def init_cmd(exercises_path: Path):
+@click.option(
+    "--skip-warmup",
+    is_flag=True,
+    help="Don't pre-populate the torch.compile cache",
+)
+def init_cmd(exercises_path: Path, skip_warmup: bool):
     """Initialise the exercises directory & Python environment."""
     if not exercises_path.exists():
         exercises_path.mkdir(parents=True, exist_ok=True)
+    workspace = exercises_path.resolve()
 
     try:
         import torchlings.exercises
@@ -58,6 +72,17 @@ def init_cmd(exercises_path: Path):
     click.echo(f"Created exercises directory: {exercises_path}")
     click.echo(click.style("Setting up Python environment...", fg="cyan"))
     setup_python_environment(exercises_path)
+    install_runtime(workspace)
+    precompile_workspace(workspace)
+
+    if not skip_warmup:
+        click.echo(
+            click.style(
+                "Warming the torch.compile cache (this can take a minute)...",
+                fg="cyan",
+            )
+        )
+        warm_compile_cache(workspace)
 
     click.secho("\nTorchlings initialised successfully!", fg="green", bold=True)
     click.echo(
@@ -74,9 +99,32 @@ def init_cmd(exercises_path: Path):
     show_default=True,
     help="Path to exercises directory",
 )
-def run_cmd(exercises_path: Path):
+@click.option(
+    "--threads",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads per test run  [default: a share of the CPUs, at most 4]",
+)
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Show where the time of every test run went",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Show the FLOPs, memory, op count and budget checks of every test",
+)
+def run_cmd(
+    exercises_path: Path, threads: int | None, timings: bool, profile: bool
+):
     """Launch the interactive testing interface."""
-    runner = Runner(exercises_path=exercises_path)
+    runner = Runner(
+        exercises_path=exercises_path,
+        threads=threads,
+        show_timings=timings,
+        show_profile=profile,
+    )
     runner.run()
 
 
@@ -90,15 +138,91 @@ def run_cmd(exercises_path: Path):
     show_default=True,
     help="Path to exercises directory",
 )
-def start_cmd(folder: str, exercises_path: Path):
+@click.option(
+    "--threads",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads per test run  [default: a share of the CPUs, at most 4]",
+)
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Show where the time of every test run went",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Show the FLOPs, memory, op count and budget checks of every test",
+)
+def start_cmd(
+    folder: str,
+    exercises_path: Path,
+    threads: int | None,
+    timings: bool,
+    profile: bool,
+):
     """Start from a specific section and run until the end.
 
     FOLDER is the section name to start from, e.g. 03_nn or just nn.
     """
-    runner = Runner(exercises_path=exercises_path, start_from=folder)
+    runner = Runner(
+        exercises_path=exercises_path,
+        start_from=folder,
+        threads=threads,
+        show_timings=timings,
+        show_profile=profile,
+    )
     runner.run()
 
 
+@cli.command("dashboard")
+@click.option(
+    "--exercises-path",
+    "-e",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    default=Path("exercises"),
+    show_default=True,
+    help="Path to exercises directory",
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Exercises checked in parallel  [default: 1-2 depending on CPUs]",
+)
+@click.option(
+    "--threads",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads per test run  [default: a share of the CPUs, at most 4]",
+)
+def dashboard_cmd(exercises_path: Path, workers: int | None, threads: int | None):
+    """Check every exercise in the background and show a live grid."""
+    Dashboard(exercises_path=exercises_path, workers=workers, threads=threads).run()
+
+
+@cli.command("best")
+@click.option(
+    "--exercises-path",
+    "-e",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    default=Path("exercises"),
+    show_default=True,
+    help="Path to exercises directory",
+)
+def best_cmd(exercises_path: Path):
+    """Show your latest and best timings against the reference solutions."""
+    lines = format_bests(load_bests(exercises_path))
+    if not lines:
+        click.echo(
+            "No timings yet. Solutions are timed against a reference each time"
+            " an exercise that has one passes."
+        )
+        return
+    click.echo("\n".join(lines))
+
+
 def main():
     print_banner()
     print_welcome_message()
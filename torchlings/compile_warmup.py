@@ -0,0 +1,151 @@
+"""Pre-populate the torch.compile caches with the 09_compile reference models.
+
+Run by ``torchlings init`` with the exercise venv's interpreter and the same
+cache and thread environment the runner uses. Models, input shapes and the
+order they are compiled in mirror the tests, so the FX-graph and kernel
+caches are hit on the learner's first run.
+"""
+
+import os
+import time
+import torch
+import torch.nn as nn
+
+
+class TransformerBlock(nn.Module):
+    def __init__(self, dim=64, num_heads=4):
+        super().__init__()
+        self.attn = nn.MultiheadAttention(dim, num_heads, batch_first=True)
+        self.norm1 = nn.LayerNorm(dim)
+        self.norm2 = nn.LayerNorm(dim)
+        self.ffn = nn.Sequential(
+            nn.Linear(dim, dim * 4),
+            nn.GELU(),
+            nn.Linear(dim * 4, dim),
+        )
+
+    def forward(self, x):
+        x = x + self.attn(self.norm1(x), self.norm1(x), self.norm1(x))[0]
+        x = x + self.ffn(self.norm2(x))
+        return x
+
+
+def _mlp():
+    return nn.Sequential(
+        nn.Linear(64, 128),
+        nn.ReLU(),
+        nn.Linear(128, 64),
+        nn.ReLU(),
+        nn.Linear(64, 10),
+    )
+
+
+def _polynomial(x):
+    return x * x + 2 * x + 1
+
+
+def _matmul_plus_one(x, y):
+    return torch.matmul(x, y.T) + 1.0
+
+
+def _relu_linear(x, W, b):
+    return torch.relu(x @ W.T + b)
+
+
+@torch.compiler.disable
+def _not_compiled(x):
+    return x
+
+
+def _around_disabled(x):
+    return _not_compiled(x * 2) + 1
+
+
+def _after_reset(make_fn):
+    def make():
+        torch._dynamo.reset()
+        return make_fn()
+
+    return make
+
+
+# One list per exercise file, in the order its tests compile. pytest runs
+# each file in one process without resetting dynamo between tests, and
+# dynamo compiles differently then: a second nn.Linear with new shapes is
+# recompiled with dynamic shapes. The lists are replayed the same way.
+EXERCISE_CASES = {
+    "09_compile/1.py": [
+        ("polynomial", lambda: _polynomial, lambda: (torch.randn(3),), {}),
+        ("mlp", _mlp, lambda: (torch.randn(2, 64),), {}),
+        (
+            "linear reduce-overhead",
+            lambda: nn.Linear(64, 32),
+            lambda: (torch.randn(4, 64),),
+            {"mode": "reduce-overhead"},
+        ),
+        ("linear", lambda: nn.Linear(16, 8), lambda: (torch.randn(4, 16),), {}),
+        (
+            "matmul fullgraph",
+            lambda: _matmul_plus_one,
+            lambda: (torch.randn(3, 4), torch.randn(5, 4)),
+            {"fullgraph": True},
+        ),
+    ],
+    "09_compile/2.py": [
+        (
+            "relu linear fullgraph",
+            lambda: _relu_linear,
+            lambda: (torch.randn(2, 3), torch.randn(4, 3), torch.randn(4)),
+            {"fullgraph": True},
+        ),
+    ],
+    "09_compile/3.py": [
+        (
+            "transformer default",
+            TransformerBlock,
+            lambda: (torch.randn(2, 8, 64),),
+            {"mode": "default"},
+        ),
+        (
+            "transformer reduce-overhead",
+            TransformerBlock,
+            lambda: (torch.randn(2, 8, 64),),
+            {"mode": "reduce-overhead"},
+        ),
+        (
+            "transformer max-autotune",
+            TransformerBlock,
+            lambda: (torch.randn(2, 8, 64),),
+            {"mode": "max-autotune"},
+        ),
+        (
+            "linear after reset",
+            _after_reset(lambda: nn.Linear(32, 16)),
+            lambda: (torch.randn(4, 32),),
+            {},
+        ),
+        ("disabled region", lambda: _around_disabled, lambda: (torch.randn(4, 4),), {}),
+    ],
+}
+
+
+def main():
+    # C++ kernels are specialised on the thread count, so use the runs' one,
+    # which the torchlings pytest plugin sets the same way
+    threads = os.environ.get("TORCHLINGS_INTRA_OP_THREADS")
+    if threads:
+        torch.set_num_threads(int(threads))
+    for exercise, cases in EXERCISE_CASES.items():
+        torch._dynamo.reset()
+        for name, make_fn, make_inputs, compile_kwargs in cases:
+            start = time.perf_counter()
+            try:
+                torch.compile(make_fn(), **compile_kwargs)(*make_inputs())
+            except Exception as e:
+                print(f"  {exercise} {name}: skipped ({type(e).__name__}: {e})")
+                continue
+            print(f"  {exercise} {name}: {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Check every exercise in the background and show a live pass/fail grid."""
+
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import click
+from watchfiles import PythonFilter, watch
+from torchlings.analysis import precheck
+from torchlings.modal_runner import is_gpu_exercise
+from torchlings.output import format_failure_line, format_result_line
+from torchlings.runner import EXERCISE_ORDER, Runner
+from torchlings.utils import file_digest
+from torchlings.workspace import state_dir
+
+CACHE_FILE = "dashboard.json"
+
+# status -> (symbol, style) for the grid
+STATUS_STYLES = {
+    "passed": ("✓", {"fg": "green", "bold": True}),
+    "failed": ("✗", {"fg": "red", "bold": True}),
+    "todo": ("·", {"dim": True}),
+    "error": ("!", {"fg": "red"}),
+    "remote": ("☁", {"fg": "cyan"}),
+    "running": ("~", {"fg": "yellow"}),
+    "queued": ("?", {"fg": "yellow", "dim": True}),
+}
+
+STATUS_DESCRIPTION = {
+    "passed": "passed",
+    "failed": "failed",
+    "todo": "not started",
+    "error": "syntax error",
+    "remote": "GPU only, not run",
+    "running": "running",
+    "queued": "queued",
+}
+
+
+def default_workers() -> int:
+    """Each run imports torch, so keep the pool small even on big machines."""
+    return max(1, min(2, (os.cpu_count() or 1) // 2))
+
+
+class Dashboard:
+    def __init__(
+        self,
+        exercises_path: Path,
+        workers: int | None = None,
+        threads: int | None = None,
+    ):
+        self.exercises_path = exercises_path
+        self.runner = Runner(exercises_path, threads=threads)
+        self.workers = workers or default_workers()
+        self.runner.concurrent_runs = self.workers
+        self.cache_file = state_dir(exercises_path) / CACHE_FILE
+        # content hash -> (status, formatted result lines)
+        self._results: dict[str, tuple[str, list[str]]] = self._load_cache()
+        # exercise -> content hash of what is on disk right now
+        self._current: dict[Path, str] = {}
+        self._running: set[str] = set()
+        self._last_changed: Path | None = None
+        self._lock = threading.Lock()
+
+    def run(self):
+        """Check everything once, then recheck files as they are saved."""
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            for exercise in self.runner.exercises:
+                self._submit(pool, exercise)
+            self._render()
+
+            exercises = {e.resolve(): e for e in self.runner.exercises}
+            for changes in watch(self.exercises_path, watch_filter=PythonFilter()):
+                for _, changed in changes:
+                    exercise = exercises.get(Path(changed).resolve())
+                    if exercise is not None and exercise.exists():
+                        self._last_changed = exercise
+                        self._submit(pool, exercise)
+                self._render()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Checks already running finish; queued ones are dropped
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, pool: ThreadPoolExecutor, exercise: Path) -> None:
+        """Queue a check of the exercise unless its content was seen before."""
+        digest = file_digest(exercise)
+        with self._lock:
+            self._current[exercise] = digest
+            if digest in self._results or digest in self._running:
+                return
+            self._running.add(digest)
+        pool.submit(self._check, exercise, digest).add_done_callback(
+            lambda _: self._render()
+        )
+
+    def _check(self, exercise: Path, digest: str) -> None:
+        try:
+            result = self._evaluate(exercise)
+        except Exception as e:
+            result = ("failed", [format_failure_line("check", f"{type(e).__name__}: {e}")])
+        with self._lock:
+            self._running.discard(digest)
+            # A file edited mid-run is resubmitted under its new hash, so a
+            # result for older content only goes into the cache.
+            self._results[digest] = result
+            self._save_cache()
+
+    def _evaluate(self, exercise: Path) -> tuple[str, list[str]]:
+        """Status and result lines of one exercise, run quietly."""
+        target = str(exercise.resolve())
+        if is_gpu_exercise(target) and not self.runner._has_cuda():
+            return "remote", []
+        check = precheck(target)
+        if check.syntax_error:
+            return "error", [format_failure_line("syntax error", check.syntax_error)]
+        lines = [format_failure_line(t, reason) for t, reason in check.doomed.items()]
+        if not check.runnable:
+            return "todo", lines
+        results = asyncio.run(
+            self.runner._run_pytest_locally(
+                target, tests=check.runnable if check.doomed else None, background=True
+            )
+        )
+        lines += [format_result_line(r.name, r.passed, r.error) for r in results]
+        passed = not check.doomed and bool(results) and all(r.passed for r in results)
+        return ("passed" if passed else "failed"), lines
+
+    def _status(self, exercise: Path) -> str:
+        digest = self._current.get(exercise)
+        if digest in self._results:
+            return self._results[digest][0]
+        return "running" if digest in self._running else "queued"
+
+    def _render(self) -> None:
+        with self._lock:
+            lines = self._grid_lines()
+            click.clear()
+            click.echo("\n".join(lines))
+
+    def _grid_lines(self) -> list[str]:
+        sections: dict[str, list[Path]] = {}
+        for exercise in self.runner.exercises:
+            sections.setdefault(exercise.parent.name, []).append(exercise)
+
+        counts = {status: 0 for status in STATUS_STYLES}
+        lines = [click.style("Dashboard", fg="yellow", bold=True), ""]
+        width = max(map(len, [*EXERCISE_ORDER, *sections]))
+        for section, exercises in sections.items():
+            cells = []
+            for exercise in exercises:
+                status = self._status(exercise)
+                counts[status] += 1
+                symbol, style = STATUS_STYLES[status]
+                cells.append(click.style(symbol, **style))
+            lines.append(f"  {section:<{width}}  " + " ".join(cells))
+
+        lines.append("")
+        lines.append(
+            "  "
+            + "   ".join(
+                click.style(STATUS_STYLES[s][0], **STATUS_STYLES[s][1])
+                + f" {STATUS_DESCRIPTION[s]} ({n})"
+                for s, n in counts.items()
+                if n
+            )
+        )
+
+        if self._last_changed is not None:
+            lines.append("")
+            relative = self._last_changed.relative_to(self.exercises_path)
+            lines.append(click.style(f"Last saved: {relative}", fg="yellow", bold=True))
+            digest = self._current.get(self._last_changed)
+            lines.extend(self._results.get(digest, ("", []))[1])
+        lines.append("")
+        lines.append(click.style("Watching for changes, Ctrl-C to quit", dim=True))
+        return lines
+
+    def _load_cache(self) -> dict[str, tuple[str, list[str]]]:
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        return {
+            digest: (entry["status"], entry["lines"])
+            for digest, entry in data.items()
+        }
+
+    def _save_cache(self) -> None:
+        """Persist results for the content currently on disk."""
+        live = set(self._current.values())
+        data = {
+            digest: {"status": status, "lines": lines}
+            for digest, (status, lines) in self._results.items()
+            if digest in live
+        }
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_file.write_text(json.dumps(data))
@@ -1,6 +1,7 @@
 # Advanced tensor indexing, slicing, and gathering operations
 
 import torch
+from torchlings.testing import assert_max_ops
 
 
 def advanced_indexing():
@@ -16,7 +17,8 @@ def gather_operation():
     tensor = torch.tensor([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
     indices = torch.tensor([[0, 2], [1, 0], [2, 1]])
     # TODO: Collect elements along dim=1
-    # Bonus points if you use a inbuilt torch function
+    # Use an inbuilt torch function: the test counts the torch ops you run,
+    # and a loop over the elements needs dozens
     # Expected: [[1, 3], [5, 4], [9, 8]]
 
     result = None
@@ -35,7 +37,7 @@ def index_add_operation():
     tensor = torch.ones(5, 3)
     indices = torch.tensor([0, 2, 4])
     values = torch.tensor([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=torch.float)
-    # TODO: Add values to tensor at specified row indices
+    # TODO: Add values to tensor at specified row indices, in one operation
 
     result = None
     return result
@@ -62,6 +64,8 @@ def test_advanced_indexing():
 
 def test_gather_operation():
     assert gather_operation().tolist() == [[1, 3], [5, 4], [9, 8]]
+    # One gather (or one indexing op), not a loop over the elements
+    assert_max_ops(gather_operation, max_ops=6)
 
 
 def test_masked_selection():
@@ -72,6 +76,7 @@ def test_index_add_operation():
     result = index_add_operation()
     assert result[0, 0] == 2.0  # 1.0 + 1.0
     assert result[2, 1] == 6.0  # 1.0 + 5.0
+    assert_max_ops(index_add_operation, max_ops=6)
 
 
 def test_narrow_and_select():
@@ -1,5 +1,6 @@
 # Complex tensor transformations: stacking, splitting, and advanced operations
 import torch
+from torchlings.testing import assert_scaling
 
 
 def stack_tensors():
@@ -99,6 +100,16 @@ def concatenate_tensors():
     return cat_dim0, cat_dim1, stacked_3d
 
 
+def join_chunks(chunks):
+    # chunks is a list of 1D tensors, like the pieces of a long recording
+    # TODO: Join them end to end into a single 1D tensor
+    # The test times this for more and more chunks. Growing a result with
+    # torch.cat inside a loop copies everything joined so far on every step.
+
+    joined = None
+    return joined
+
+
 """
 ----------------------TESTS-------------------------
 ------------------DO NOT TOUCH TESTS---------------
@@ -162,3 +173,14 @@ def test_concatenate_tensors():
     assert c0.shape == torch.Size([6, 2])
     assert c1.shape == torch.Size([2, 6])
     assert s3d.shape == torch.Size([3, 2, 2])
+
+
+def test_join_chunks():
+    chunks = [torch.arange(3), torch.arange(3, 5), torch.arange(5, 9)]
+    assert join_chunks(chunks).tolist() == list(range(9))
+    assert_scaling(
+        join_chunks,
+        lambda n: ([torch.randn(1000) for _ in range(n)],),
+        sizes=[32, 64, 128, 256],
+        max_exponent=1,
+    )
@@ -0,0 +1,114 @@
+# Vectorization: replacing Python loops with broadcasting and einsum
+import torch
+from torchlings.testing import assert_close, assert_max_ops
+
+# Every function ending in _loop below works, but runs a handful of tiny
+# torch ops per element from Python. Each one is paid for in interpreter
+# and dispatch overhead, so the loop spends its time on bookkeeping rather
+# than arithmetic. Rewrite each without a Python loop; the tests check the
+# results match and count the ops your version runs.
+
+
+def pairwise_distances_loop(a, b):
+    # a is (n, d), b is (m, d): the Euclidean distance between every a[i] and b[j]
+    distances = torch.empty(a.shape[0], b.shape[0])
+    for i in range(a.shape[0]):
+        for j in range(b.shape[0]):
+            distances[i, j] = ((a[i] - b[j]) ** 2).sum().sqrt()
+    return distances
+
+
+def pairwise_distances(a, b):
+    # TODO: Compute the same (n, m) distances without a loop
+    # Hint: a[:, None] - b[None] broadcasts to (n, m, d), or use torch.cdist
+    distances = None
+    return distances
+
+
+def batched_outer_loop(x, y):
+    # x is (batch, n), y is (batch, m): the outer product of each pair of rows
+    out = torch.empty(x.shape[0], x.shape[1], y.shape[1])
+    for k in range(x.shape[0]):
+        out[k] = torch.outer(x[k], y[k])
+    return out
+
+
+def batched_outer(x, y):
+    # TODO: Compute the same (batch, n, m) outer products without a loop
+    # Hint: torch.einsum("bi,bj->bij", x, y) names each dimension, and
+    # dimensions that appear in the output but aren't summed over
+    out = None
+    return out
+
+
+def normalize_rows_loop(x):
+    # Rescale every row to zero mean and unit standard deviation
+    out = torch.empty_like(x)
+    for i in range(x.shape[0]):
+        out[i] = (x[i] - x[i].mean()) / x[i].std()
+    return out
+
+
+def normalize_rows(x):
+    # TODO: Normalize every row at once
+    # Hint: x.mean(dim=1, keepdim=True) keeps the reduced dimension, so the
+    # (rows, 1) result broadcasts against x
+    out = None
+    return out
+
+
+def one_hot_loop(labels, num_classes):
+    # labels holds class indices; row i gets a 1.0 in column labels[i]
+    out = torch.zeros(labels.shape[0], num_classes)
+    for i, label in enumerate(labels):
+        out[i, label] = 1.0
+    return out
+
+
+def one_hot(labels, num_classes):
+    # TODO: Build the same float one-hot matrix without a loop
+    # Hint: compare labels[:, None] with torch.arange(num_classes), or look
+    # at torch.nn.functional.one_hot (it returns integers)
+    out = None
+    return out
+
+
+"""
+----------------------TESTS-------------------------
+------------------DO NOT TOUCH TESTS----------------
+"""
+
+
+def test_pairwise_distances(perf_budget):
+    torch.manual_seed(0)
+    a, b = torch.randn(5, 3), torch.randn(4, 3)
+    assert_close(pairwise_distances(a, b), pairwise_distances_loop(a, b), rtol=1e-4, atol=1e-5)
+
+    a, b = torch.randn(64, 16), torch.randn(48, 16)
+    assert_max_ops(pairwise_distances, a, b, max_ops=10)
+    # At least 10× faster than the loop
+    perf_budget(pairwise_distances, a, b, baseline=pairwise_distances_loop, max_slowdown=0.1)
+
+
+def test_batched_outer():
+    torch.manual_seed(0)
+    x, y = torch.randn(8, 3), torch.randn(8, 4)
+    assert_close(batched_outer(x, y), batched_outer_loop(x, y))
+
+    x, y = torch.randn(64, 10), torch.randn(64, 12)
+    assert_max_ops(batched_outer, x, y, max_ops=10)
+
+
+def test_normalize_rows():
+    torch.manual_seed(0)
+    x = torch.randn(100, 20) * 3 + 1
+    assert_close(normalize_rows(x), normalize_rows_loop(x), rtol=1e-4, atol=1e-6)
+    assert_max_ops(normalize_rows, x, max_ops=8)
+
+
+def test_one_hot():
+    labels = torch.tensor([2, 0, 3, 3, 1])
+    assert_close(one_hot(labels, 4), one_hot_loop(labels, 4))
+
+    labels = torch.randint(0, 10, (100,))
+    assert_max_ops(one_hot, labels, 10, max_ops=10)
@@ -1,5 +1,6 @@
 # Computing gradients with autograd
 import torch
+from torchlings.testing import assert_close
 
 
 def simple_gradient():
@@ -25,4 +26,4 @@ def simple_gradient():
 def test_gradient():
     grad = simple_gradient()
     expected = torch.tensor([4 / 3, 2.0, 8 / 3])
-    assert torch.allclose(grad, expected, atol=1e-5)
+    assert_close(grad, expected, atol=1e-5)
@@ -1,5 +1,6 @@
 # Controlling which parts of computation contribute to gradients
 import torch
+from torchlings.testing import assert_close
 
 
 def selective_gradient_branches():
@@ -42,4 +43,4 @@ def selective_gradient_branches():
 def test_selective_gradients():
     grad = selective_gradient_branches()
     expected = torch.tensor([6.0, 5.0, 34.0])
-    assert torch.allclose(grad, expected)
+    assert_close(grad, expected)
@@ -1,6 +1,7 @@
 # Linear layers: the building block of neural networks
 import torch
 import torch.nn as nn
+from torchlings.testing import assert_close
 
 
 def create_linear_layer():
@@ -39,16 +40,14 @@ def count_parameters():
     return total
 
 
-def manual_linear():
+def manual_linear(x, weight, bias):
     # A linear layer computes y = xW^T + b
     # TODO: Manually compute what nn.Linear does using matrix operations
-    torch.manual_seed(0)
-    layer = nn.Linear(3, 2)
-    x = torch.tensor([[1.0, 2.0, 3.0]])
-
-    # Use layer.weight and layer.bias to compute the output manually
+    # x is (batch, in_features), weight is (out_features, in_features)
+    # and bias is (out_features,). The test also times this on a large
+    # batch, so use matrix operations rather than looping over rows.
     output = None
-    return output, layer(x)
+    return output
 
 
 """
@@ -88,6 +87,17 @@ def test_count_parameters():
     assert total == 55  # 10*5 + 5
 
 
-def test_manual_linear():
-    manual, builtin = manual_linear()
-    assert torch.allclose(manual, builtin, atol=1e-5)
+def test_manual_linear(perf_budget):
+    torch.manual_seed(0)
+    layer = nn.Linear(3, 2)
+    x = torch.tensor([[1.0, 2.0, 3.0]])
+    with torch.no_grad():
+        manual = manual_linear(x, layer.weight, layer.bias)
+        assert_close(manual, layer(x), atol=1e-5)
+
+        x = torch.randn(256, 128)
+        weight, bias = torch.randn(64, 128), torch.randn(64)
+        perf_budget(
+            manual_linear, x, weight, bias,
+            baseline=nn.functional.linear, max_slowdown=10,
+        )
@@ -2,6 +2,7 @@
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from torchlings.testing import assert_close
 
 
 def apply_relu():
@@ -71,44 +72,44 @@ def leaky_relu():
 def test_apply_relu():
     result = apply_relu()
     expected = torch.tensor([0.0, 0.0, 0.0, 1.0, 2.0])
-    assert torch.allclose(result, expected)
+    assert_close(result, expected)
 
 
 def test_apply_sigmoid():
     result = apply_sigmoid()
     assert result.shape == torch.Size([3])
     assert torch.all(result >= 0) and torch.all(result <= 1)
-    assert torch.allclose(result[1], torch.tensor(0.5))
+    assert_close(result[1], torch.tensor(0.5))
 
 
 def test_apply_tanh():
     result = apply_tanh()
     assert result.shape == torch.Size([3])
     assert torch.all(result >= -1) and torch.all(result <= 1)
-    assert torch.allclose(result[1], torch.tensor(0.0))
+    assert_close(result[1], torch.tensor(0.0))
 
 
 def test_apply_softmax():
     probs = apply_softmax()
-    assert torch.allclose(probs.sum(), torch.tensor(1.0))
+    assert_close(probs.sum(), torch.tensor(1.0))
     assert torch.all(probs > 0)
 
 
 def test_apply_gelu():
     result = apply_gelu()
     assert result.shape == torch.Size([3])
-    assert torch.allclose(result[1], torch.tensor(0.0))
+    assert_close(result[1], torch.tensor(0.0))
     assert result[2] > result[0]
 
 
 def test_module_vs_functional():
     r_mod, r_func = module_vs_functional()
     expected = torch.tensor([0.0, 0.0, 1.0, 2.0])
-    assert torch.allclose(r_mod, expected)
-    assert torch.allclose(r_func, expected)
+    assert_close(r_mod, expected)
+    assert_close(r_func, expected)
 
 
 def test_leaky_relu():
     result = leaky_relu()
     expected = torch.tensor([-0.2, -0.1, 0.0, 1.0, 2.0])
-    assert torch.allclose(result, expected)
+    assert_close(result, expected)
@@ -1,6 +1,7 @@
 # Custom nn.Module: writing your own layers and models
 import torch
 import torch.nn as nn
+from torchlings.testing import count_flops
 
 
 # TODO: Define a custom module called TwoLayerNet
@@ -53,6 +54,8 @@ def test_two_layer_net():
     assert out.shape == torch.Size([3, 5])
     assert hasattr(model, "fc1")
     assert hasattr(model, "fc2")
+    # 2 FLOPs per weight per example: 2 * 3 * (10*20 + 20*5)
+    assert count_flops(model, x).flops == 1800, "forward should run fc1 and fc2 once each"
 
 
 def test_residual_block():
@@ -62,6 +65,8 @@ def test_residual_block():
     assert out.shape == torch.Size([2, 8])
     # Output should differ from input (the block adds something)
     assert not torch.allclose(out, x)
+    # 2 * 2 * (8*8 + 8*8)
+    assert count_flops(block, x).flops == 512, "forward should run fc1 and fc2 once each"
 
 
 def test_get_named_parameters():
@@ -1,6 +1,7 @@
 # Normalization: stabilizing training
 import torch
 import torch.nn as nn
+from torchlings.testing import assert_close
 
 
 def apply_batch_norm():
@@ -84,8 +85,8 @@ def test_apply_layer_norm():
 
 def test_layer_norm_properties():
     mean, std = layer_norm_properties()
-    assert torch.allclose(mean, torch.tensor([0.0]), atol=1e-5)
-    assert torch.allclose(std, torch.tensor([1.0]), atol=0.2)
+    assert_close(mean, torch.tensor([0.0]), atol=1e-5)
+    assert_close(std, torch.tensor([1.0]), atol=0.2)
 
 
 def test_group_norm():
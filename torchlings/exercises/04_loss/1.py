@@ -1,6 +1,7 @@
 # Regression losses: measuring prediction error
 import torch
 import torch.nn as nn
+from torchlings.testing import assert_close, assert_max_ops
 
 
 def mse_loss():
@@ -36,11 +37,11 @@ def mse_loss_no_reduction():
     return loss
 
 
-def manual_mse():
-    predictions = torch.tensor([2.5, 0.0, 2.0, 8.0])
-    targets = torch.tensor([3.0, -0.5, 2.0, 7.0])
+def manual_mse(predictions, targets):
     # TODO: Compute MSE manually (without nn.MSELoss)
     # MSE = mean((predictions - targets)^2)
+    # The test also runs this on large tensors against a time budget,
+    # so work on whole tensors instead of looping over elements.
     loss = None
     return loss
 
@@ -63,13 +64,13 @@ def weighted_mse():
 def test_mse_loss():
     loss = mse_loss()
     expected = torch.tensor(0.375)
-    assert torch.allclose(loss, expected, atol=1e-4)
+    assert_close(loss, expected, atol=1e-4)
 
 
 def test_l1_loss():
     loss = l1_loss()
     expected = torch.tensor(0.5)
-    assert torch.allclose(loss, expected, atol=1e-4)
+    assert_close(loss, expected, atol=1e-4)
 
 
 def test_huber_loss():
@@ -82,16 +83,19 @@ def test_mse_loss_no_reduction():
     loss = mse_loss_no_reduction()
     assert loss.shape == torch.Size([3])
     expected = torch.tensor([0.25, 0.25, 0.25])
-    assert torch.allclose(loss, expected)
+    assert_close(loss, expected)
+
 
+def test_manual_mse(perf_budget):
+    predictions = torch.tensor([2.5, 0.0, 2.0, 8.0])
+    targets = torch.tensor([3.0, -0.5, 2.0, 7.0])
+    manual = manual_mse(predictions, targets)
+    builtin = nn.MSELoss()(predictions, targets)
+    assert_close(manual, builtin, atol=1e-5)
+    assert_max_ops(manual_mse, predictions, targets, max_ops=5)
 
-def test_manual_mse():
-    manual = manual_mse()
-    builtin = nn.MSELoss()(
-        torch.tensor([2.5, 0.0, 2.0, 8.0]),
-        torch.tensor([3.0, -0.5, 2.0, 7.0]),
-    )
-    assert torch.allclose(manual, builtin, atol=1e-5)
+    predictions, targets = torch.randn(20_000), torch.randn(20_000)
+    perf_budget(manual_mse, predictions, targets, baseline=nn.MSELoss(), max_slowdown=10)
 
 
 def test_weighted_mse():
@@ -99,4 +103,4 @@ def test_weighted_mse():
     # weights * (pred - target)^2 = [1*0.01, 2*0.25, 1*0, 3*0.64]
     # = [0.01, 0.5, 0.0, 1.92] -> mean = 0.6075
     expected = torch.tensor(0.6075)
-    assert torch.allclose(loss, expected, atol=1e-4)
+    assert_close(loss, expected, atol=1e-4)
@@ -2,6 +2,7 @@
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from torchlings.testing import assert_close
 
 
 def cross_entropy_loss():
@@ -83,7 +84,7 @@ def test_nll_loss():
 
 def test_cross_entropy_vs_nll():
     ce, nll = cross_entropy_vs_nll()
-    assert torch.allclose(ce, nll, atol=1e-5)
+    assert_close(ce, nll, atol=1e-5)
 
 
 def test_binary_cross_entropy():
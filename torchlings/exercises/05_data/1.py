@@ -1,6 +1,7 @@
 # Custom Dataset: implementing the Dataset interface
 import torch
 from torch.utils.data import Dataset
+from torchlings.testing import assert_close
 
 
 # TODO: Implement a custom dataset that holds (x, y) pairs
@@ -73,7 +74,7 @@ def test_dataset_indexing():
     sample = dataset_indexing()
     assert isinstance(sample, tuple)
     x, y = sample
-    assert torch.allclose(x, torch.tensor([3.0, 4.0]))
+    assert_close(x, torch.tensor([3.0, 4.0]))
     assert y.item() == 1
 
 
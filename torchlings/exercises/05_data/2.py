@@ -1,6 +1,7 @@
 # DataLoader: batching and iterating over data
 import torch
 from torch.utils.data import DataLoader, TensorDataset
+from torchlings.testing import assert_close
 
 
 def create_dataloader():
@@ -75,7 +76,7 @@ def test_get_first_batch():
     batch = get_first_batch()
     x_batch, y_batch = batch
     assert x_batch.shape == torch.Size([5, 1])
-    assert torch.allclose(x_batch.squeeze(), torch.arange(5).float())
+    assert_close(x_batch.squeeze(), torch.arange(5).float())
 
 
 def test_count_batches():
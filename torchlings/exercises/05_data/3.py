@@ -87,12 +87,23 @@ def apply_dict_collate():
 """
 
 
-def test_pad_collate_fn():
+def padded_reference(batch):
+    return pad_sequence(batch, batch_first=True)
+
+
+def test_pad_collate_fn(perf_budget):
     batch = [torch.tensor([1.0, 2.0]), torch.tensor([3.0, 4.0, 5.0])]
     result = pad_collate_fn(batch)
     assert result.shape == torch.Size([2, 3])
     assert result[0, 2].item() == 0.0  # padding
 
+    # pad_sequence copies one row at a time too, but in C++. A version that
+    # redoes work for every row, like finding the longest sequence again,
+    # falls far behind it.
+    lengths = torch.randint(200, 400, (512,)).tolist()
+    batch = [torch.randn(length) for length in lengths]
+    perf_budget(pad_collate_fn, batch, baseline=padded_reference, max_slowdown=3.0)
+
 
 def test_collate_with_lengths():
     batch = [torch.tensor([1.0, 2.0]), torch.tensor([3.0, 4.0, 5.0])]
@@ -1,6 +1,7 @@
 # The training loop: forward, loss, backward, step
 import torch
 import torch.nn as nn
+from torchlings.testing import assert_close
 
 
 def single_training_step():
@@ -111,7 +112,7 @@ def test_eval_mode_no_dropout():
     x = torch.randn(4, 4)
     model.eval()
     out2 = model(x)
-    assert torch.allclose(output, out2)
+    assert_close(output, out2)
 
 
 def test_train_vs_eval():
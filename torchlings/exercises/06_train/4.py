@@ -3,6 +3,7 @@ import torch
 import torch.nn as nn
 import tempfile
 import os
+from torchlings.testing import assert_close
 
 
 def save_model_state(model, path):
@@ -73,7 +74,7 @@ def test_save_and_load_model():
         save_model_state(model, path)
         loaded = load_model_state(path)
         loaded_output = loaded(x)
-        assert torch.allclose(original_output, loaded_output)
+        assert_close(original_output, loaded_output)
     finally:
         os.unlink(path)
 
@@ -0,0 +1,87 @@
+# Saving memory: in-place ops, activation checkpointing and smaller dtypes
+import torch
+import torch.nn as nn
+from torch.utils.checkpoint import checkpoint
+from torchlings.testing import assert_close, assert_max_memory
+
+
+def scale_and_shift_(x, scale, shift):
+    # x * scale + shift allocates a new tensor for every operation.
+    # In-place ops (the ones ending in _) write into x instead.
+    # TODO: Multiply x by scale and add shift, in place, and return x
+    # Hint: x.mul_(scale) returns x, so in-place calls can be chained
+    result = None
+    return result
+
+
+class CheckpointedMLP(nn.Module):
+    # Backward needs every block's activations, so a plain forward pass
+    # keeps them all alive until backward. Activation checkpointing keeps
+    # only each block's input and recomputes the rest during backward,
+    # trading compute for memory.
+    def __init__(self, dim, depth):
+        super().__init__()
+        self.blocks = nn.ModuleList(
+            nn.Sequential(nn.Linear(dim, dim), nn.ReLU(), nn.Linear(dim, dim), nn.ReLU())
+            for _ in range(depth)
+        )
+
+    def forward(self, x):
+        # TODO: Run x through every block, calling each one through
+        # checkpoint(block, x, use_reentrant=False)
+        return None
+
+
+def compact_embeddings(embeddings):
+    # float32 takes 4 bytes per element. bfloat16 takes 2 and keeps the
+    # range of float32, giving up precision instead.
+    # TODO: Return the embeddings as a torch.bfloat16 tensor
+    compact = None
+    return compact
+
+
+"""
+----------------------TESTS-------------------------
+------------------DO NOT TOUCH TESTS----------------
+"""
+
+
+def test_scale_and_shift_(memory_usage):
+    x = torch.randn(100_000)
+    expected = x * 2 + 1
+    with memory_usage() as usage:
+        result = scale_and_shift_(x, 2.0, 1.0)
+    assert result is x, "should return x itself, modified in place"
+    assert_close(result, expected)
+    # Nothing but x should be written to
+    assert_max_memory(usage, allocated_bytes=1024)
+
+
+def test_checkpointed_mlp(memory_usage):
+    torch.manual_seed(0)
+    model = CheckpointedMLP(128, 8)
+    x = torch.randn(2048, 128, requires_grad=True)
+    with memory_usage() as usage:
+        model(x).sum().backward()
+    grad = x.grad
+
+    # The same blocks without checkpointing
+    x.grad = None
+    with memory_usage() as plain_usage:
+        plain = x
+        for block in model.blocks:
+            plain = block(plain)
+        plain.sum().backward()
+    assert_close(grad, x.grad, rtol=1e-4, atol=1e-6)
+    # Besides the block inputs, one block's activations are alive at a time
+    assert_max_memory(usage, peak_bytes=int(plain_usage.peak_bytes * 0.7))
+
+
+def test_compact_embeddings(memory_usage):
+    embeddings = torch.randn(10_000, 64)
+    with memory_usage() as usage:
+        compact = compact_embeddings(embeddings)
+    assert compact.dtype == torch.bfloat16
+    assert_close(compact.float(), embeddings, rtol=1e-2, atol=1e-2)
+    # Half the 2.4 MB of float32, plus nothing else
+    assert_max_memory(usage, peak_bytes=embeddings.numel() * 2)
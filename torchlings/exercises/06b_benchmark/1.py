@@ -0,0 +1,125 @@
+# Benchmarking: timing code with torch.utils.benchmark
+import torch
+import torch.utils.benchmark as benchmark
+from torch.utils.benchmark.utils.common import Measurement
+
+# time.time() around a single call mostly measures noise: the first call
+# pays for lazy initialisation, and one call of a fast op is shorter than
+# the timer's resolution. benchmark.Timer runs the statement many times
+# and also takes care of warmup and thread settings.
+
+
+def time_matmul():
+    a = torch.randn(128, 128)
+    b = torch.randn(128, 128)
+    # TODO: Create a benchmark.Timer for the statement "a @ b"
+    # The statement is a string; pass the tensors with globals={"a": a, "b": b}
+    timer = None
+
+    # TODO: Time it with timer.timeit(100), which runs the statement 100 times
+    measurement = None
+    return measurement
+
+
+def autorange_matmul():
+    a = torch.randn(128, 128)
+    b = torch.randn(128, 128)
+    timer = benchmark.Timer(stmt="a @ b", globals={"a": a, "b": b})
+    # timeit needs the number of runs picked by hand. blocked_autorange
+    # picks how many runs go in a block so each block is long enough to
+    # time precisely, then keeps timing blocks for at least min_run_time.
+    # TODO: Measure with blocked_autorange, min_run_time=0.1
+    measurement = None
+    return measurement
+
+
+def matmul_stats():
+    a = torch.randn(128, 128)
+    b = torch.randn(128, 128)
+    timer = benchmark.Timer(stmt="a @ b", globals={"a": a, "b": b})
+    measurement = timer.blocked_autorange(min_run_time=0.1)
+    # A Measurement keeps one time per block, in seconds per run
+    # TODO: Return the median time per run, the interquartile range of the
+    # block times, and how many runs each block made
+    # Hint: look at measurement.median, measurement.iqr and measurement.number_per_run
+    median = None
+    iqr = None
+    runs_per_block = None
+    return median, iqr, runs_per_block
+
+
+def time_with_setup():
+    # Code in setup runs once before timing starts and isn't measured,
+    # so building the inputs doesn't count towards the op being timed
+    # TODO: Create a Timer for "x.sum()" that builds x in its setup with
+    # "x = torch.randn(1000, 1000)"
+    # Hint: the setup code needs torch too, pass globals={"torch": torch}
+    timer = None
+
+    # TODO: Time it with timer.timeit(20)
+    measurement = None
+    return measurement
+
+
+def labelled_matmul():
+    a = torch.randn(64, 64)
+    b = torch.randn(64, 64)
+    # label, sub_label and description name a measurement. When measurements
+    # are compared, the label titles the table, the sub_label names the row
+    # and the description names the column.
+    # TODO: Time "a @ b" with timeit(100) on a Timer with label="matmul",
+    # sub_label="64x64" and description="float32"
+    measurement = None
+    return measurement
+
+
+"""
+----------------------TESTS-------------------------
+------------------DO NOT TOUCH TESTS----------------
+"""
+
+
+def test_time_matmul():
+    measurement = time_matmul()
+    assert isinstance(measurement, Measurement)
+    assert measurement.task_spec.stmt == "a @ b"
+    assert measurement.number_per_run == 100
+    # Times are in seconds per run: far below a second for a small matmul
+    assert 0 < measurement.median < 0.01
+
+
+def test_autorange_matmul():
+    measurement = autorange_matmul()
+    assert isinstance(measurement, Measurement)
+    assert measurement.task_spec.stmt == "a @ b"
+    # Every block's total time counts towards min_run_time
+    assert sum(measurement.raw_times) >= 0.1
+    assert measurement.number_per_run > 1
+
+
+def test_matmul_stats():
+    median, iqr, runs_per_block = matmul_stats()
+    assert isinstance(median, float) and 0 < median < 0.01
+    assert isinstance(iqr, float) and iqr >= 0
+    assert isinstance(runs_per_block, int) and runs_per_block > 1
+
+
+def test_time_with_setup():
+    measurement = time_with_setup()
+    assert isinstance(measurement, Measurement)
+    assert measurement.task_spec.stmt == "x.sum()"
+    assert "randn" in measurement.task_spec.setup
+    # Summing a million numbers is much faster than generating them, which
+    # only holds if generating them happened outside the timed statement
+    generating = benchmark.Timer(
+        "torch.randn(1000, 1000)", globals={"torch": torch}
+    ).timeit(5)
+    assert measurement.median < generating.median
+
+
+def test_labelled_matmul():
+    measurement = labelled_matmul()
+    assert isinstance(measurement, Measurement)
+    assert measurement.label == "matmul"
+    assert measurement.sub_label == "64x64"
+    assert measurement.description == "float32"
@@ -0,0 +1,99 @@
+# Comparing implementations: loops vs vectorized code, and batching
+import torch
+import torch.nn as nn
+import torch.utils.benchmark as benchmark
+from torch.utils.benchmark.utils.common import Measurement
+from torchlings.testing import assert_close
+
+
+def loop_row_norms(x):
+    # Works, but runs a few tiny ops per row from Python
+    norms = torch.empty(x.shape[0])
+    for i in range(x.shape[0]):
+        norms[i] = (x[i] ** 2).sum().sqrt()
+    return norms
+
+
+def vectorized_row_norms(x):
+    # TODO: Compute the same row norms as loop_row_norms without a loop
+    # Hint: square, sum over dim=1, sqrt -- or torch.linalg.vector_norm
+    return None
+
+
+def benchmark_row_norms():
+    x = torch.randn(1000, 64)
+    results = []
+    for name, fn in [("loop", loop_row_norms), ("vectorized", vectorized_row_norms)]:
+        # TODO: Create a Timer for "fn(x)" with globals={"fn": fn, "x": x},
+        # label="row norms", sub_label="1000x64" and description=name.
+        # Measure it with blocked_autorange(min_run_time=0.05) and append
+        # the measurement to results.
+        pass
+    return results
+
+
+def compare_table(results):
+    # benchmark.Compare lays measurements out as a table: one per label,
+    # a row per sub_label and a column per description
+    # TODO: Build a Compare from the results and return its table as a string
+    # Hint: str(compare) renders the table
+    table = None
+    return table
+
+
+def benchmark_batching():
+    torch.manual_seed(0)
+    model = nn.Sequential(nn.Linear(128, 256), nn.ReLU(), nn.Linear(256, 10)).eval()
+    x = torch.randn(64, 128)
+    # TODO: Time two ways of running the model on all 64 rows of x, both
+    # with blocked_autorange(min_run_time=0.05), under torch.no_grad():
+    #   description="batched":        the statement "model(x)"
+    #   description="one at a time":  the statement "[model(row) for row in x]"
+    # Use label="forward" and sub_label="64 rows" for both.
+    # Hint: globals={"model": model, "x": x}; running the timing inside a
+    # `with torch.no_grad():` block is enough, Timer runs in the same thread
+    results = []
+    return results
+
+
+"""
+----------------------TESTS-------------------------
+------------------DO NOT TOUCH TESTS----------------
+"""
+
+
+def test_vectorized_row_norms():
+    x = torch.randn(100, 16)
+    assert_close(vectorized_row_norms(x), loop_row_norms(x), rtol=1e-4)
+
+
+def test_benchmark_row_norms():
+    results = benchmark_row_norms()
+    assert len(results) == 2
+    assert all(isinstance(m, Measurement) for m in results)
+    loop, vectorized = results
+    assert [loop.description, vectorized.description] == ["loop", "vectorized"]
+    assert loop.label == vectorized.label == "row norms"
+    # One op over the whole tensor beats a thousand rounds of tiny ops
+    assert vectorized.median * 5 < loop.median
+
+
+def test_compare_table():
+    results = benchmark_row_norms()
+    table = compare_table(results)
+    assert isinstance(table, str)
+    assert "row norms" in table
+    assert "1000x64" in table
+    assert "loop" in table and "vectorized" in table
+
+
+def test_benchmark_batching():
+    results = benchmark_batching()
+    assert len(results) == 2
+    assert all(isinstance(m, Measurement) for m in results)
+    batched, one_at_a_time = sorted(results, key=lambda m: m.description)
+    assert batched.description == "batched"
+    assert one_at_a_time.description == "one at a time"
+    assert batched.sub_label == one_at_a_time.sub_label == "64 rows"
+    # One matmul over the batch amortises the per-call overhead of 64 calls
+    assert batched.median * 2 < one_at_a_time.median
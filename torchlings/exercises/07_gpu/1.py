@@ -1,6 +1,7 @@
 # Device management: moving tensors between CPU and GPU
 import torch
 import torch.nn as nn
+from torchlings.testing import assert_close
 
 # These exercises require a CUDA GPU to run.
 # If you don't have a GPU, you can run these on Modal.
@@ -93,7 +94,7 @@ def test_create_tensor_on_gpu():
 def test_move_tensor_to_gpu():
     t = move_tensor_to_gpu()
     assert t.device.type == "cuda"
-    assert torch.allclose(t.cpu(), torch.tensor([1.0, 2.0, 3.0]))
+    assert_close(t.cpu(), torch.tensor([1.0, 2.0, 3.0]))
 
 
 @requires_cuda
@@ -112,7 +113,7 @@ def test_tensor_device_check():
 def test_operations_same_device():
     result = operations_same_device()
     assert result.device.type == "cuda"
-    assert torch.allclose(result.cpu(), torch.tensor([4.0, 6.0]))
+    assert_close(result.cpu(), torch.tensor([4.0, 6.0]))
 
 
 @requires_cuda
@@ -2,6 +2,7 @@
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from torchlings.testing import assert_max_flops, count_flops
 
 
 # TODO: Build a simple CNN for image classification
@@ -40,22 +41,21 @@ def global_average_pooling():
     return pooled
 
 
-def depthwise_separable_conv():
+def depthwise_separable_conv(in_channels, out_channels):
     # Depthwise separable conv = depthwise conv + pointwise conv
-    # Much fewer parameters than standard conv
-    x = torch.randn(1, 32, 16, 16)
+    # Much fewer parameters and FLOPs than a standard 3x3 conv
 
     # TODO: Create depthwise conv (groups=in_channels, each channel convolved separately)
-    # Conv2d(32, 32, 3, padding=1, groups=32)
+    # Conv2d(in_channels, in_channels, 3, padding=1, groups=in_channels)
     depthwise = None
 
     # TODO: Create pointwise conv (1x1 conv to mix channels)
-    # Conv2d(32, 64, 1)
+    # Conv2d(in_channels, out_channels, 1)
     pointwise = None
 
-    # TODO: Apply depthwise then pointwise
-    output = None
-    return output
+    # TODO: Chain them with nn.Sequential, depthwise first
+    block = None
+    return block
 
 
 def count_conv_parameters():
@@ -83,6 +83,9 @@ def test_simple_cnn():
     x = torch.randn(4, 1, 28, 28)
     output = model(x)
     assert output.shape == torch.Size([4, 10])
+    # Per image: conv1 0.23M, conv2 1.81M and fc 0.03M multiply-adds ×2
+    flops = count_flops(model, x).flops
+    assert flops == 8_253_952, "the layers don't match the architecture"
 
 
 def test_feature_map_shapes():
@@ -97,8 +100,12 @@ def test_global_average_pooling():
 
 
 def test_depthwise_separable_conv():
-    output = depthwise_separable_conv()
+    block = depthwise_separable_conv(32, 64)
+    x = torch.randn(1, 32, 16, 16)
+    output = block(x)
     assert output.shape == torch.Size([1, 64, 16, 16])
+    # It replaces Conv2d(32, 64, 3, padding=1) at about an eighth of the work
+    assert_max_flops(block, x, baseline=nn.Conv2d(32, 64, 3, padding=1), max_ratio=0.2)
 
 
 def test_count_conv_parameters():
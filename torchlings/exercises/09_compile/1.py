@@ -2,6 +2,7 @@
 import torch
 import torch.nn as nn
 import pytest
+from torchlings.testing import assert_close
 
 requires_cuda = pytest.mark.skipif(
     not torch.cuda.is_available(), reason="CUDA not available"
@@ -74,7 +75,7 @@ def test_compile_simple_function():
     x = torch.tensor([1.0, 2.0, 3.0])
     result = fn(x)
     expected = x * x + 2 * x + 1
-    assert torch.allclose(result, expected)
+    assert_close(result, expected)
 
 
 def test_compile_model():
@@ -93,7 +94,7 @@ def test_compile_with_mode():
 
 def test_compiled_produces_same_output():
     eager, compiled = compiled_produces_same_output()
-    assert torch.allclose(eager, compiled, atol=1e-5)
+    assert_close(eager, compiled, atol=1e-5)
 
 
 def test_compile_with_fullgraph():
@@ -102,4 +103,4 @@ def test_compile_with_fullgraph():
     y = torch.randn(5, 4)
     result = fn(x, y)
     expected = torch.matmul(x, y.T) + 1.0
-    assert torch.allclose(result, expected, atol=1e-5)
+    assert_close(result, expected, atol=1e-5)
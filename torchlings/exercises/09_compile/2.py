@@ -1,6 +1,7 @@
 # Graph breaks: what prevents torch.compile from optimizing your code
 import torch
 import torch.nn as nn
+from torchlings.testing import assert_close
 
 
 def no_graph_break():
@@ -97,19 +98,19 @@ def test_no_graph_break():
     x = torch.randn(2, 3)
     result = fn(x, W, b)
     expected = torch.relu(x @ W.T + b)
-    assert torch.allclose(result, expected, atol=1e-5)
+    assert_close(result, expected, atol=1e-5)
     # Should compile without graph breaks
     compiled = torch.compile(fn, fullgraph=True)
     compiled_result = compiled(x, W, b)
-    assert torch.allclose(compiled_result, expected, atol=1e-5)
+    assert_close(compiled_result, expected, atol=1e-5)
 
 
 def test_data_dependent_control_flow():
     _, good_fn = data_dependent_control_flow()
     x_pos = torch.tensor([1.0, 2.0, 3.0])
     x_neg = torch.tensor([-1.0, -2.0, -3.0])
-    assert torch.allclose(good_fn(x_pos), x_pos * 2)
-    assert torch.allclose(good_fn(x_neg), x_neg * 3)
+    assert_close(good_fn(x_pos), x_pos * 2)
+    assert_close(good_fn(x_neg), x_neg * 3)
 
 
 def test_avoid_python_list_ops():
@@ -117,7 +118,7 @@ def test_avoid_python_list_ops():
     x = torch.tensor([1.0, 2.0, 3.0])
     expected = bad_fn(x)
     result = good_fn(x)
-    assert torch.allclose(result, expected)
+    assert_close(result, expected)
 
 
 def test_avoid_numpy_conversion():
@@ -125,7 +126,7 @@ def test_avoid_numpy_conversion():
     x = torch.tensor([1.0, 2.0, 3.0])
     result = good_fn(x)
     expected = torch.tensor([2.0, 4.0, 6.0])
-    assert torch.allclose(result, expected)
+    assert_close(result, expected)
 
 
 def test_static_shapes_matter():
@@ -133,5 +134,5 @@ def test_static_shapes_matter():
     x = torch.randn(10, 4)
     result = pad_fn(x)
     assert result.shape == torch.Size([32, 4])
-    assert torch.allclose(result[:10], x)
-    assert torch.allclose(result[10:], torch.zeros(22, 4))
+    assert_close(result[:10], x)
+    assert_close(result[10:], torch.zeros(22, 4))
@@ -1,6 +1,7 @@
 # Custom autograd.Function: defining your own forward and backward passes
 import torch
 from torch.autograd import Function
+from torchlings.testing import assert_close
 
 
 # TODO: Implement a custom ReLU using autograd.Function
@@ -82,17 +83,17 @@ def use_ste():
 
 def test_custom_relu():
     output, grad = use_custom_relu()
-    assert torch.allclose(output, torch.tensor([0.0, 0.0, 1.0, 2.0]))
-    assert torch.allclose(grad, torch.tensor([0.0, 0.0, 1.0, 1.0]))
+    assert_close(output, torch.tensor([0.0, 0.0, 1.0, 2.0]))
+    assert_close(grad, torch.tensor([0.0, 0.0, 1.0, 1.0]))
 
 
 def test_gradient_clip():
     grad = use_gradient_clip()
-    assert torch.allclose(grad, torch.tensor([0.5, 0.5, 0.5]))
+    assert_close(grad, torch.tensor([0.5, 0.5, 0.5]))
 
 
 def test_ste():
     binary, grad = use_ste()
-    assert torch.allclose(binary, torch.tensor([-1.0, 1.0, 1.0, 1.0]))
+    assert_close(binary, torch.tensor([-1.0, 1.0, 1.0, 1.0]))
     # Straight-through: gradient is 1 everywhere
-    assert torch.allclose(grad, torch.tensor([1.0, 1.0, 1.0, 1.0]))
+    assert_close(grad, torch.tensor([1.0, 1.0, 1.0, 1.0]))
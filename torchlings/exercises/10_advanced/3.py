@@ -1,9 +1,17 @@
 # Triton kernels: writing custom GPU kernels
+import os
 import torch
 import pytest
+from torchlings.testing import assert_close
+
+# With TRITON_INTERPRET=1 Triton runs kernels on the CPU with numpy,
+# so the kernels below can be tested on CPU tensors without a GPU.
+TRITON_INTERPRET = os.environ.get("TRITON_INTERPRET") == "1"
+DEVICE = "cpu" if TRITON_INTERPRET else "cuda"
 
 requires_cuda = pytest.mark.skipif(
-    not torch.cuda.is_available(), reason="CUDA not available"
+    not TRITON_INTERPRET and not torch.cuda.is_available(),
+    reason="CUDA not available (set TRITON_INTERPRET=1 to use the CPU interpreter)",
 )
 
 try:
@@ -65,7 +73,7 @@ if HAS_TRITON:
 
 
 def triton_vector_add(x, y):
-    assert x.is_cuda and y.is_cuda
+    assert x.device.type == DEVICE and y.device.type == DEVICE
     output = torch.empty_like(x)
     n = x.numel()
     # TODO: Launch vector_add_kernel with the right grid
@@ -76,7 +84,7 @@ def triton_vector_add(x, y):
 
 
 def triton_relu(x):
-    assert x.is_cuda
+    assert x.device.type == DEVICE
     output = torch.empty_like(x)
     n = x.numel()
     # TODO: Launch relu_kernel
@@ -86,7 +94,7 @@ def triton_relu(x):
 
 
 def triton_fused_mul_add(x, a, b):
-    assert x.is_cuda
+    assert x.device.type == DEVICE
     output = torch.empty_like(x)
     n = x.numel()
     # TODO: Launch fused_mul_add_kernel
@@ -104,28 +112,28 @@ def triton_fused_mul_add(x, a, b):
 @requires_cuda
 @requires_triton
 def test_triton_vector_add():
-    x = torch.randn(1024, device="cuda")
-    y = torch.randn(1024, device="cuda")
+    x = torch.randn(1024, device=DEVICE)
+    y = torch.randn(1024, device=DEVICE)
     result = triton_vector_add(x, y)
     expected = x + y
-    assert torch.allclose(result, expected, atol=1e-5)
+    assert_close(result, expected, atol=1e-5)
 
 
 @requires_cuda
 @requires_triton
 def test_triton_relu():
-    x = torch.randn(1024, device="cuda")
+    x = torch.randn(1024, device=DEVICE)
     result = triton_relu(x)
     expected = torch.relu(x)
-    assert torch.allclose(result, expected, atol=1e-5)
+    assert_close(result, expected, atol=1e-5)
 
 
 @requires_cuda
 @requires_triton
 def test_triton_fused_mul_add():
-    x = torch.randn(1024, device="cuda")
-    a = torch.tensor(2.5, device="cuda")
-    b = torch.tensor(-1.0, device="cuda")
+    x = torch.randn(1024, device=DEVICE)
+    a = torch.tensor(2.5, device=DEVICE)
+    b = torch.tensor(-1.0, device=DEVICE)
     result = triton_fused_mul_add(x, a, b)
     expected = 2.5 * x + (-1.0)
-    assert torch.allclose(result, expected, atol=1e-4)
+    assert_close(result, expected, atol=1e-4)
@@ -1,11 +1,77 @@
 """Run GPU exercises on Modal when CUDA is not available locally."""
 
+import base64
+import json
+import os
 import shutil
 import subprocess
+import tempfile
+from pathlib import Path
+from typing import Iterator
 import click
+from torchlings.runtime import PYTEST_PLUGIN, read_runtime_sources
 
 MODAL_SIGNUP_URL = "https://modal.com"
 GPU_SECTIONS = {"07_gpu", "09_compile", "10_advanced"}
+EVENT_FD_ENV = "TORCHLINGS_EVENT_FD"
+
+# The remote worker runs pytest with the torchlings plugin, which writes one
+# JSON event per test to a pipe. The worker yields those lines as they arrive
+# and the local entrypoint forwards them to the fd torchlings handed to
+# `modal run`, so nothing has to be scraped out of Modal's own output.
+MODAL_SCRIPT = """import modal
+import base64, json, os, subprocess, sys, tempfile
+
+app = modal.App("torchlings")
+image = modal.Image.debian_slim(python_version="3.12").pip_install(
+    "torch", "pytest", "numpy", "triton"
+)
+
+PAYLOAD_B64 = "__PAYLOAD_B64__"
+
+
+@app.function(gpu="T4", image=image, timeout=180)
+def run_exercise():
+    payload = json.loads(base64.b64decode(PAYLOAD_B64).decode("utf-8"))
+    workdir = tempfile.mkdtemp(dir="/tmp")
+    package_dir = os.path.join(workdir, "lib", "torchlings")
+    os.makedirs(package_dir)
+    for name, source in payload["runtime"].items():
+        with open(os.path.join(package_dir, name), "w") as f:
+            f.write(source)
+    path = os.path.join(workdir, payload["name"])
+    with open(path, "w") as f:
+        f.write(payload["exercise"])
+
+    read_fd, write_fd = os.pipe()
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.join(workdir, "lib")
+    env["__EVENT_FD_ENV__"] = str(write_fd)
+    with tempfile.TemporaryFile(mode="w+") as log:
+        proc = subprocess.Popen(
+            [
+                sys.executable, "-m", "pytest", *payload["pytest_args"],
+                *([path + "::" + t for t in payload["tests"]] or [path]),
+            ],
+            env=env, pass_fds=(write_fd,), stdout=log, stderr=subprocess.STDOUT,
+            text=True, cwd=workdir,
+        )
+        os.close(write_fd)
+        with os.fdopen(read_fd) as events:
+            for line in events:
+                yield line.rstrip("\\n")
+        returncode = proc.wait()
+        log.seek(0)
+        output = log.read()[-4000:]
+    yield json.dumps({"event": "done", "returncode": returncode, "output": output})
+
+
+@app.local_entrypoint()
+def main():
+    fd = int(os.environ["__EVENT_FD_ENV__"])
+    for line in run_exercise.remote_gen():
+        os.write(fd, (line + "\\n").encode())
+"""
 
 
 def is_gpu_exercise(exercise_path) -> bool:
@@ -14,6 +80,16 @@ def is_gpu_exercise(exercise_path) -> bool:
     return any(section in parts for section in GPU_SECTIONS)
 
 
+def is_triton_exercise(exercise_path) -> bool:
+    """Check if this exercise writes Triton kernels."""
+    try:
+        with open(exercise_path) as f:
+            source = f.read()
+    except OSError:
+        return False
+    return "import triton" in source
+
+
 def check_modal_available() -> tuple[bool, str]:
     """Check if Modal CLI is installed and authenticated."""
     if not shutil.which("modal"):
@@ -54,3 +130,83 @@ def print_modal_setup_guide():
     click.echo("Then re-run this exercise.")
     click.echo(click.style("─" * 50, fg="yellow"))
     click.echo()
+
+
+def build_modal_script(
+    target: str, pytest_args: list[str], tests: list[str] | None = None
+) -> str:
+    """Render the Modal app that runs one exercise on a remote GPU."""
+    payload = {
+        "name": Path(target).name,
+        "exercise": Path(target).read_text(),
+        "runtime": read_runtime_sources(),
+        "pytest_args": [*pytest_args, "-p", PYTEST_PLUGIN],
+        "tests": tests or [],
+    }
+    payload_b64 = base64.b64encode(json.dumps(payload).encode()).decode()
+    return (
+        MODAL_SCRIPT.replace("__PAYLOAD_B64__", payload_b64)
+        .replace("__EVENT_FD_ENV__", EVENT_FD_ENV)
+    )
+
+
+def stream_modal_events(
+    target: str, pytest_args: list[str], tests: list[str] | None = None
+) -> Iterator[dict]:
+    """Run an exercise (or some of its tests) on Modal, yielding test events.
+
+    The last event is always {"event": "done", ...}; if the remote job never
+    reported back, it carries the tail of Modal's own output instead.
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".py", delete=False, prefix="torchlings_modal_"
+    ) as f:
+        f.write(build_modal_script(target, pytest_args, tests))
+        script_path = f.name
+
+    read_fd, write_fd = os.pipe()
+    env = os.environ.copy()
+    env[EVENT_FD_ENV] = str(write_fd)
+    log = tempfile.TemporaryFile(mode="w+")
+    proc = None
+    try:
+        proc = subprocess.Popen(
+            ["modal", "run", script_path],
+            env=env,
+            pass_fds=(write_fd,),
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        os.close(write_fd)
+        write_fd = None
+
+        done = False
+        with os.fdopen(read_fd) as events:
+            read_fd = None
+            for line in events:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(event, dict):
+                    done = done or event.get("event") == "done"
+                    yield event
+
+        returncode = proc.wait()
+        if not done:
+            log.seek(0)
+            yield {
+                "event": "done",
+                "returncode": returncode,
+                "output": log.read()[-4000:],
+            }
+    finally:
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        for fd in (read_fd, write_fd):
+            if fd is not None:
+                os.close(fd)
+        log.close()
+        os.unlink(script_path)
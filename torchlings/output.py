@@ -1,56 +1,311 @@
 """Parse and format pytest output into friendly messages."""
 
 import re
+from typing import NamedTuple
 import click
 
+ALL_PASSED_MESSAGE = click.style("All tests passed!", fg="green", bold=True)
+
+
+class TestResult(NamedTuple):
+    """Outcome of one test function."""
+
+    __test__ = False
+
+    name: str
+    passed: bool
+    # raw E-lines of the failure, empty for passing tests
+    error: str = ""
+
+
+# Verbose result lines look like: "path/file.py::test_name PASSED  [ 50%]"
+RESULT_LINE = re.compile(r"::(\w+)\s+(PASSED|FAILED)")
+# Failure sections start with: "____________ test_name ____________"
+SECTION_HEADER = re.compile(r"^_{3,} (\S+) _{3,}$")
+
+# Output from a test that prints a large tensor or loops on print() is
+# dropped past these limits instead of being held in memory.
+MAX_LINE_CHARS = 1000
+MAX_ERROR_LINES = 20
+TRUNCATED = " ... [truncated]"
+
 
 def format_test_output(stdout: str, stderr: str) -> tuple[bool, str]:
     """Parse pytest output and return (passed, friendly_message)."""
-    lines = stdout.splitlines()
+    return format_results(parse_test_output(stdout))
 
-    passed_tests = []
-    failed_tests = []
-    seen = set()
 
-    for line in lines:
-        # Only parse the verbose test result lines (with PASSED/FAILED markers)
-        # These look like: "path/file.py::test_name PASSED  [ 50%]"
-        match = re.match(r".*::(\w+)\s+(PASSED|FAILED)", line)
+def parse_test_output(stdout: str) -> list[TestResult]:
+    """Collect per-test results from verbose pytest output, passes first."""
+    parser = TestOutputParser()
+    parser.feed(stdout)
+    return parser.results()
+
+
+class TestOutputParser:
+    """Single-pass parser for verbose pytest output, fed in arbitrary chunks.
+
+    Memory stays bounded however much a run prints: only result lines and
+    the E-lines of each failure are kept, over-long lines are cut at
+    MAX_LINE_CHARS and each failure keeps at most MAX_ERROR_LINES.
+    """
+
+    __test__ = False
+
+    def __init__(self):
+        self._partial = ""
+        self._partial_truncated = False
+        # test name -> passed, in the order results were reported
+        self._outcomes: dict[str, bool] = {}
+        self._errors: dict[str, list[str]] = {}
+        self._dropped: dict[str, int] = {}
+        self._section: str | None = None
+
+    def feed(self, data: str) -> None:
+        """Consume the next chunk of output."""
+        pieces = data.split("\n")
+        for piece in pieces[:-1]:
+            self._extend_partial(piece)
+            self._flush()
+        self._extend_partial(pieces[-1])
+
+    def close(self) -> None:
+        """Flush a final line that had no trailing newline."""
+        if self._partial:
+            self._flush()
+
+    def results(self) -> list[TestResult]:
+        """Results parsed so far, passes first like the old report order."""
+        self.close()
+        passed = [TestResult(t, True) for t, ok in self._outcomes.items() if ok]
+        failed = [
+            TestResult(t, False, self._error_for(t))
+            for t, ok in self._outcomes.items()
+            if not ok
+        ]
+        return passed + failed
+
+    def _extend_partial(self, text: str) -> None:
+        room = MAX_LINE_CHARS - len(self._partial)
+        if len(text) > room:
+            self._partial_truncated = True
+        if room > 0:
+            self._partial += text[:room]
+
+    def _flush(self) -> None:
+        line = self._partial
+        if self._partial_truncated:
+            line += TRUNCATED
+        self._partial = ""
+        self._partial_truncated = False
+        self._feed_line(line)
+
+    def _feed_line(self, line: str) -> None:
+        line = line.rstrip("\r")
+        match = RESULT_LINE.search(line)
         if match:
-            name = match.group(1)
-            status = match.group(2)
-            if name not in seen:
-                seen.add(name)
-                if status == "PASSED":
-                    passed_tests.append(name)
-                else:
-                    failed_tests.append(name)
-
-    all_passed = len(failed_tests) == 0 and len(passed_tests) > 0
-
-    if all_passed:
-        parts = [click.style("All tests passed!", fg="green", bold=True)]
-        for t in passed_tests:
-            fn_name = _test_to_fn_name(t)
-            parts.append("  " + click.style(fn_name, fg="green"))
-        return True, "\n".join(parts)
-
-    # Build friendly failure message
-    output_parts = []
-
-    for t in passed_tests:
-        fn_name = _test_to_fn_name(t)
-        output_parts.append("  " + click.style(fn_name, fg="green"))
-
-    for test_name in failed_tests:
-        fn_name = _test_to_fn_name(test_name)
-        error_detail = _extract_error_for_test(test_name, stdout)
-        friendly = _make_friendly(fn_name, error_detail)
-        output_parts.append(
-            "  " + click.style(fn_name, fg="red") + " -- " + friendly
+            name, status = match.groups()
+            self._outcomes.setdefault(name, status == "PASSED")
+            return
+
+        stripped = line.strip()
+        header = SECTION_HEADER.match(stripped)
+        if header:
+            name = header.group(1).rsplit(".", 1)[-1]
+            self._section = name if name not in self._errors else None
+            if self._section is not None:
+                self._errors[name] = []
+            return
+        if stripped.startswith("____") or stripped.startswith("===="):
+            self._section = None
+            return
+        if self._section is not None and stripped.startswith("E "):
+            errors = self._errors[self._section]
+            if len(errors) < MAX_ERROR_LINES:
+                errors.append(stripped[2:].strip())
+            else:
+                self._dropped[self._section] = self._dropped.get(self._section, 0) + 1
+
+    def _error_for(self, name: str) -> str:
+        lines = list(self._errors.get(name, []))
+        if self._dropped.get(name):
+            lines.append(f"... [{self._dropped[name]} more lines truncated]")
+        return "\n".join(lines)
+
+
+def format_results(results: list[TestResult]) -> tuple[bool, str]:
+    """Render parsed results, with a header when every test passed."""
+    all_passed = len(results) > 0 and all(r.passed for r in results)
+    parts = [ALL_PASSED_MESSAGE] if all_passed else []
+    for r in results:
+        parts.append(format_result_line(r.name, r.passed, r.error))
+    return all_passed, "\n".join(parts)
+
+
+def format_result_line(test_name: str, passed: bool, error_detail: str = "") -> str:
+    """Format a single test result the way the runner prints it."""
+    fn_name = _test_to_fn_name(test_name)
+    if passed:
+        return "  " + click.style(fn_name, fg="green")
+    return format_failure_line(test_name, _make_friendly(fn_name, error_detail))
+
+
+def format_failure_line(test_name: str, reason: str) -> str:
+    """Format a failed test with an already friendly reason."""
+    fn_name = _test_to_fn_name(test_name)
+    return "  " + click.style(fn_name, fg="red") + " -- " + reason
+
+
+def format_inconclusive(test_name: str, reason: str) -> str:
+    """Format a test that passed without its time budget being judged."""
+    fn_name = _test_to_fn_name(test_name)
+    return (
+        "  "
+        + click.style(fn_name, fg="yellow")
+        + f" -- timing inconclusive: {reason}"
+        + click.style(" (counted as passed)", dim=True)
+    )
+
+
+def format_timings(
+    phases: dict[str, float], total: float, threads: int | None = None
+) -> str:
+    """One dim line breaking a run's wall time down by phase."""
+    parts = [f"{name.replace('_', ' ')} {_seconds(t)}" for name, t in phases.items()]
+    parts.append(f"total {_seconds(total)}")
+    if threads:
+        parts.append(f"{threads} thread{'s' if threads > 1 else ''}")
+    return "  " + click.style("timings: " + " · ".join(parts), dim=True)
+
+
+def _seconds(t: float) -> str:
+    return f"{t * 1000:.0f}ms" if t < 0.1 else f"{t:.2f}s"
+
+
+def _precise_seconds(t: float) -> str:
+    if t < 1e-3:
+        return f"{t * 1e6:.1f}µs"
+    return f"{t * 1000:.2f}ms" if t < 1 else f"{t:.2f}s"
+
+
+def format_personal_best(name: str, seconds: float, previous: float) -> str:
+    return "  " + click.style(
+        f"★ new personal best for {name}: {_precise_seconds(seconds)}"
+        f" (was {_precise_seconds(previous)})",
+        fg="green",
+        bold=True,
+    )
+
+
+def format_bests(bests: dict[str, dict[str, dict]]) -> list[str]:
+    """Table of every timed function: current, personal best and reference.
+
+    Empty when nothing has been timed yet.
+    """
+    rows = [
+        (exercise, name, entry)
+        for exercise, functions in sorted(bests.items())
+        for name, entry in functions.items()
+    ]
+    if not rows:
+        return []
+    width = max(len(f"{exercise} {name}") for exercise, name, _ in rows)
+    header = f"  {'function':<{width}}  {'current':>9}  {'best':>9}  {'reference':>9}"
+    lines = [click.style(header, bold=True)]
+    for exercise, name, entry in rows:
+        label = f"{exercise} " + click.style(name, fg="cyan")
+        padding = " " * (width - len(f"{exercise} {name}"))
+        best = f"{_precise_seconds(entry['best']):>9}"
+        if entry["best"] <= entry["reference"]:
+            best = click.style(best, fg="green", bold=True)
+        lines.append(
+            f"  {label}{padding}  {_precise_seconds(entry['current']):>9}"
+            f"  {best}  {_precise_seconds(entry['reference']):>9}"
         )
+    return lines
 
-    return False, "\n".join(output_parts)
+
+def format_reference(comparison: dict[str, dict]) -> list[str]:
+    """One line per function rating its time and memory against the reference."""
+    lines = []
+    for name, c in comparison.items():
+        time_ratio = c["seconds"] / c["reference_seconds"] if c["reference_seconds"] else 1.0
+        if c["reference_peak_bytes"]:
+            memory = f"{c['peak_bytes'] / c['reference_peak_bytes']:.1f}× the memory"
+        elif c["peak_bytes"]:
+            memory = f"{c['peak_bytes'] / 1024:.0f} KB more memory"
+        else:
+            memory = "no extra memory"
+        lines.append(
+            "  "
+            + click.style(f"{name} vs reference", fg="cyan")
+            + click.style(f" -- {time_ratio:.1f}× the time, {memory}", dim=True)
+        )
+    return lines
+
+
+def format_profile(profile: dict[str, dict]) -> list[str]:
+    """One dim line per test with the work its torch ops did."""
+    lines = []
+    for test, p in profile.items():
+        parts = [
+            f"{_metric(p['flops'])}FLOPs",
+            f"{_metric(p['bytes_moved'])}B moved",
+            f"{_metric(p['peak_bytes'])}B peak",
+            f"{p['ops']} ops",
+        ]
+        lines.append(
+            "  "
+            + click.style(f"profile {_test_to_fn_name(test)}: " + " · ".join(parts), dim=True)
+        )
+    return lines
+
+
+def format_perf(perf: dict[str, list[dict]]) -> list[str]:
+    """One dim line per budget check with what it measured."""
+    lines = []
+    for test, measurements in perf.items():
+        for m in measurements:
+            parts = [f"{_precise_seconds(m['seconds'])} per call"]
+            if m["budget_seconds"] is not None:
+                parts[0] += f" (budget {_precise_seconds(m['budget_seconds'])})"
+            if m["budget_bytes"] is not None:
+                parts.append(
+                    f"{_metric(m['peak_bytes'])}B peak (budget {_metric(m['budget_bytes'])}B)"
+                )
+            name = _test_to_fn_name(test)
+            if m["function"] != name:
+                name += f" ({m['function']})"
+            lines.append("  " + click.style(f"perf {name}: " + " · ".join(parts), dim=True))
+    return lines
+
+
+def format_memory(memory: dict[str, list[dict]]) -> list[str]:
+    """One dim line per tracked block with the memory it used."""
+    lines = []
+    for test, usages in memory.items():
+        for usage in usages:
+            parts = [
+                f"{_metric(usage['peak_bytes'])}B peak",
+                f"{_metric(usage['allocated_bytes'])}B allocated",
+            ]
+            if usage["rss_peak_bytes"] is not None:
+                parts.append(f"resident +{_metric(usage['rss_peak_bytes'])}B")
+            lines.append(
+                "  "
+                + click.style(
+                    f"memory {_test_to_fn_name(test)}: " + " · ".join(parts), dim=True
+                )
+            )
+    return lines
+
+
+def _metric(value: float) -> str:
+    """A count with a metric prefix and trailing space, like "9.4 M"."""
+    for prefix, scale in (("G", 1e9), ("M", 1e6), ("k", 1e3)):
+        if value >= scale:
+            return f"{value / scale:.1f} {prefix}"
+    return f"{value:.0f} "
 
 
 def _test_to_fn_name(test_name: str) -> str:
@@ -60,27 +315,6 @@ def _test_to_fn_name(test_name: str) -> str:
     return test_name
 
 
-def _extract_error_for_test(test_name: str, stdout: str) -> str:
-    """Pull the E-lines (assertion details) for a specific test failure."""
-    lines = stdout.splitlines()
-    in_section = False
-    e_lines = []
-
-    for line in lines:
-        # Match the test section header: ____ test_name ____
-        if test_name in line and "____" in line:
-            in_section = True
-            continue
-        if in_section:
-            stripped = line.strip()
-            if stripped.startswith("E "):
-                e_lines.append(stripped[2:].strip())
-            elif stripped.startswith("____") or stripped.startswith("===="):
-                break
-
-    return "\n".join(e_lines)
-
-
 def _make_friendly(fn_name: str, error_detail: str) -> str:
     """Turn raw assertion errors into friendly messages."""
     if not error_detail:
@@ -100,6 +334,10 @@ def _make_friendly(fn_name: str, error_detail: str) -> str:
             return f"missing attribute '{match.group(1)}'"
         return "missing attribute"
 
+    # Correct but over a performance budget
+    if "BudgetExceeded:" in error_detail:
+        return error_detail.split("BudgetExceeded:", 1)[1].strip().splitlines()[0]
+
     # Shape mismatch
     shape_match = re.search(r"torch\.Size\((\[.*?\])\).*?torch\.Size\((\[.*?\])\)", error_detail)
     if shape_match:
@@ -48,3 +48,15 @@ def print_welcome_message():
             fg="bright_yellow",
         )
     )
+    click.echo(
+        click.style(
+            f"Check every exercise at once with {click.style('torchlings dashboard', fg='blue', bold=True)}",
+            fg="bright_yellow",
+        )
+    )
+    click.echo(
+        click.style(
+            f"Compare your fastest solutions with {click.style('torchlings best', fg='blue', bold=True)}",
+            fg="bright_yellow",
+        )
+    )
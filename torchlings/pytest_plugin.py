@@ -0,0 +1,294 @@
+"""pytest plugin loaded into exercise runs with ``-p torchlings.pytest_plugin``.
+
+When TORCHLINGS_EVENT_FD is set, one JSON event per line is written to that
+file descriptor as tests finish, so results can be streamed out of band
+instead of being scraped from pytest's stdout.
+
+TORCHLINGS_INTRA_OP_THREADS and TORCHLINGS_INTER_OP_THREADS size torch's
+thread pools before the first test runs, and TORCHLINGS_CPUS pins the run
+to those CPUs, so timings aren't disturbed by other runs.
+
+A test that raises torchlings.testing's Inconclusive, a time budget missed
+on a machine too busy to tell, is reported as passed. Its reason is added
+to the report under "inconclusive" and sent as an "inconclusive" event.
+
+Phase timings (torch import, collection, tests) are written as JSON to
+TORCHLINGS_REPORT_FILE when it is set, and sent as a "timings" event when
+streaming.
+
+The ``perf_budget`` fixture gives tests torchlings.testing's
+assert_within_budget. What it measured is added to the report under
+"perf" and sent as a "perf" event. The ``memory_usage`` fixture does
+the same for track_memory, under "memory".
+
+When TORCHLINGS_REFERENCE_FILE names a reference solution and every test
+passed, the exercise's functions are timed against the reference ones and
+the comparison is added to the report under "reference".
+
+With TORCHLINGS_PROFILE set, every test runs under torchlings.testing's op
+tracer, and its FLOPs, bytes moved, peak memory and op count are added to
+the report under "profile".
+"""
+
+import contextlib
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+
+import pytest
+
+_event_fd = None
+_report_file = None
+# wall-clock "started"/"finished" plus durations of each phase in seconds
+_timings = {}
+_phase_start = 0.0
+# function name -> learner and reference time and peak memory
+_reference = {}
+# test name -> work done by its torch ops, see pytest_pyfunc_call
+_profile = {}
+# test name -> why its time budget couldn't be judged
+_inconclusive = {}
+# test name -> what its perf_budget checks measured
+_perf = {}
+# test name -> what its memory_usage blocks used
+_memory = {}
+
+
+def _emit(event: dict) -> None:
+    if _event_fd is None:
+        return
+    os.write(_event_fd, (json.dumps(event) + "\n").encode())
+
+
+def _error_lines(report) -> str:
+    """Keep only the E-lines of a failure, like the stdout parser does."""
+    lines = []
+    for line in report.longreprtext.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("E "):
+            lines.append(stripped[2:].strip())
+    return "\n".join(lines)
+
+
+def _set_cpu_affinity() -> None:
+    cpus = os.environ.get("TORCHLINGS_CPUS")
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {int(cpu) for cpu in cpus.split(",")})
+    except (OSError, ValueError):
+        # CPUs taken away since the runner looked, or a bad value
+        pass
+
+
+def _set_torch_threads() -> None:
+    intra = os.environ.get("TORCHLINGS_INTRA_OP_THREADS")
+    inter = os.environ.get("TORCHLINGS_INTER_OP_THREADS")
+    if not (intra or inter):
+        return
+    import torch
+
+    if intra:
+        torch.set_num_threads(int(intra))
+    if inter:
+        try:
+            torch.set_num_interop_threads(int(inter))
+        except RuntimeError:
+            # Only allowed once, before any inter-op work has started
+            pass
+
+
+@pytest.fixture
+def perf_budget(request):
+    """assert_within_budget, recording each measurement for the report."""
+    from torchlings.testing import BudgetExceeded, Inconclusive, assert_within_budget
+
+    def check(fn, *args, **budget):
+        measurement = None
+        try:
+            measurement = assert_within_budget(fn, *args, **budget)
+            return measurement
+        except (BudgetExceeded, Inconclusive) as e:
+            measurement = e.measurement
+            raise
+        finally:
+            if measurement is not None:
+                _perf.setdefault(request.node.name, []).append(
+                    {"function": fn.__name__, **asdict(measurement)}
+                )
+
+    return check
+
+
+@pytest.fixture
+def memory_usage(request):
+    """track_memory, recording each block's usage for the report."""
+    from torchlings.testing import track_memory
+
+    @contextlib.contextmanager
+    def track():
+        usage = None
+        try:
+            with track_memory() as usage:
+                yield usage
+        finally:
+            if usage is not None:
+                _memory.setdefault(request.node.name, []).append(asdict(usage))
+
+    return track
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_pyfunc_call(pyfuncitem):
+    if not os.environ.get("TORCHLINGS_PROFILE"):
+        yield
+        return
+    from torchlings.testing import _OpTracer
+
+    with _OpTracer(flops=True) as tracer:
+        yield
+    count = tracer.result()
+    _profile[pyfuncitem.name] = {
+        "flops": count.flops,
+        "bytes_moved": count.bytes_moved,
+        "peak_bytes": count.peak_bytes,
+        "ops": count.total,
+    }
+
+
+def pytest_configure(config):
+    global _event_fd, _report_file
+    _timings["started"] = time.time()
+    # Before torch starts any threads, so they all inherit it
+    _set_cpu_affinity()
+    fd = os.environ.get("TORCHLINGS_EVENT_FD")
+    if fd:
+        _event_fd = int(fd)
+    _report_file = os.environ.get("TORCHLINGS_REPORT_FILE")
+    if _event_fd is not None or _report_file:
+        # Every exercise imports torch; doing it here times it on its own
+        # instead of hiding it inside collection.
+        start = time.perf_counter()
+        import torch  # noqa: F401
+
+        _timings["torch_import"] = time.perf_counter() - start
+    _set_torch_threads()
+
+
+def pytest_sessionstart(session):
+    global _phase_start
+    _phase_start = time.perf_counter()
+
+
+def pytest_collection_finish(session):
+    global _phase_start
+    now = time.perf_counter()
+    _timings["collection"] = now - _phase_start
+    _phase_start = now
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if "collection" in _timings:
+        _timings["tests"] = time.perf_counter() - _phase_start
+    reference = os.environ.get("TORCHLINGS_REFERENCE_FILE")
+    if reference and _report_file and session.testscollected and not session.testsfailed:
+        start = time.perf_counter()
+        module = getattr(session.items[0], "module", None)
+        if module is not None:
+            _reference.update(_compare_with_reference(module, reference))
+        _timings["benchmark"] = time.perf_counter() - start
+
+
+def _compare_with_reference(module, path: str) -> dict:
+    """Time and size the exercise's functions against a reference solution.
+
+    The reference module defines the same functions plus benchmark_inputs(),
+    which maps each function name to the arguments both versions get.
+    """
+    import importlib.util
+
+    import torch
+    from torchlings.testing import measure, peak_memory
+
+    spec = importlib.util.spec_from_file_location("torchlings_reference", path)
+    reference = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(reference)
+    torch.manual_seed(0)
+
+    comparison = {}
+    for name, args in reference.benchmark_inputs().items():
+        mine, theirs = getattr(module, name, None), getattr(reference, name)
+        if mine is None:
+            continue
+        try:
+            comparison[name] = {
+                "seconds": measure(mine, *args).seconds,
+                "reference_seconds": measure(theirs, *args).seconds,
+                "peak_bytes": peak_memory(mine, *args),
+                "reference_peak_bytes": peak_memory(theirs, *args),
+            }
+        except Exception:
+            # Passing the tests doesn't guarantee it handles other inputs
+            continue
+    return comparison
+
+
+def pytest_unconfigure(config):
+    _timings["finished"] = time.time()
+    if _report_file:
+        with open(_report_file, "w") as f:
+            json.dump(
+                {
+                    **_timings,
+                    "reference": _reference,
+                    "profile": _profile,
+                    "inconclusive": _inconclusive,
+                    "perf": _perf,
+                    "memory": _memory,
+                },
+                f,
+            )
+    _emit({"event": "timings", **_timings})
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    # Only tests that imported torchlings.testing can raise Inconclusive
+    testing = sys.modules.get("torchlings.testing")
+    if testing is None or call.excinfo is None:
+        return
+    if not call.excinfo.errisinstance(testing.Inconclusive):
+        return
+    report = outcome.get_result()
+    report.outcome = "passed"
+    report.longrepr = None
+    _inconclusive[item.name] = str(call.excinfo.value)
+
+
+def pytest_collectreport(report):
+    if report.failed:
+        _emit({"event": "error", "error": _error_lines(report)})
+
+
+def pytest_runtest_logreport(report):
+    # Report the call phase, plus setup/teardown only when they break
+    if report.when != "call" and report.passed:
+        return
+    name = report.nodeid.split("::")[-1]
+    _emit(
+        {
+            "event": "result",
+            "test": name,
+            "outcome": report.outcome,
+            "error": _error_lines(report) if report.failed else "",
+        }
+    )
+    if report.when == "call" and name in _inconclusive:
+        _emit({"event": "inconclusive", "test": name, "reason": _inconclusive[name]})
+    if report.when == "call" and name in _perf:
+        _emit({"event": "perf", "test": name, "measurements": _perf[name]})
+    if report.when == "call" and name in _memory:
+        _emit({"event": "memory", "test": name, "usages": _memory[name]})
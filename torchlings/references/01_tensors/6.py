@@ -0,0 +1,20 @@
+"""Reference solutions for 01_tensors/6.py."""
+
+import torch
+
+
+def gather_operation():
+    tensor = torch.tensor([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    indices = torch.tensor([[0, 2], [1, 0], [2, 1]])
+    return torch.gather(tensor, 1, indices)
+
+
+def index_add_operation():
+    tensor = torch.ones(5, 3)
+    indices = torch.tensor([0, 2, 4])
+    values = torch.tensor([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=torch.float)
+    return tensor.index_add(0, indices, values)
+
+
+def benchmark_inputs():
+    return {"gather_operation": (), "index_add_operation": ()}
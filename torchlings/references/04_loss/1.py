@@ -0,0 +1,11 @@
+"""Reference solutions for 04_loss/1.py."""
+
+import torch
+
+
+def manual_mse(predictions, targets):
+    return ((predictions - targets) ** 2).mean()
+
+
+def benchmark_inputs():
+    return {"manual_mse": (torch.randn(20_000), torch.randn(20_000))}
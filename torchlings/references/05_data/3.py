@@ -0,0 +1,13 @@
+"""Reference solutions for 05_data/3.py."""
+
+import torch
+from torch.nn.utils.rnn import pad_sequence
+
+
+def pad_collate_fn(batch):
+    return pad_sequence(batch, batch_first=True, padding_value=0)
+
+
+def benchmark_inputs():
+    lengths = torch.randint(200, 400, (512,)).tolist()
+    return {"pad_collate_fn": ([torch.randn(length) for length in lengths],)}
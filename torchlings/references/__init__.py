@@ -0,0 +1,7 @@
+"""Reference solutions, laid out like the exercises and never copied out.
+
+A module here defines some of its exercise's functions the way the course
+would write them, plus ``benchmark_inputs()`` mapping each of those names
+to the arguments both versions are timed with. See runtime.reference_file
+and the pytest plugin.
+"""
@@ -1,16 +1,64 @@
+import asyncio
+import codecs
+import contextlib
 import os
+import json
 import subprocess
+import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
-from torchlings.venv import VENV_NAME
-from torchlings.output import format_test_output
+from torchlings.utils import file_digest, is_ignored
+from torchlings.runtime import reference_file
+from torchlings.workspace import (
+    CONCURRENT_RUNS,
+    PROFILE_ENV,
+    REFERENCE_FILE_ENV,
+    REPORT_FILE_ENV,
+    append_history,
+    compile_cache_env,
+    cpu_affinity_env,
+    install_runtime,
+    pytest_profile_args,
+    pytest_profile_env,
+    record_timings,
+    state_dir,
+    thread_budget,
+    thread_env,
+    venv_python,
+)
+from torchlings.analysis import changed_tests, precheck
+from torchlings.output import (
+    ALL_PASSED_MESSAGE,
+    TestOutputParser,
+    TestResult,
+    format_failure_line,
+    format_inconclusive,
+    format_memory,
+    format_perf,
+    format_personal_best,
+    format_profile,
+    format_reference,
+    format_result_line,
+    format_timings,
+)
 from torchlings.modal_runner import (
     is_gpu_exercise,
+    is_triton_exercise,
     check_modal_available,
     print_modal_setup_guide,
+    stream_modal_events,
 )
-from watchfiles import watch
+from watchfiles import awatch
 import click
 
+try:
+    import termios
+    import tty
+except ImportError:  # not available on Windows
+    termios = None
+
 CONTROLS_DESCRIPTION = {
     "n": "Go to next exercise",
     "q": "Quit torchlings",
@@ -26,20 +74,63 @@ EXERCISE_ORDER = [
     "04_loss",
     "05_data",
     "06_train",
+    "06b_benchmark",
     "07_gpu",
     "08_cv",
     "09_compile",
     "10_advanced",
 ]
 
+PYTEST_ARGS = ["-v", "--tb=short", "--no-header"]
+
+# Bytes read from pytest's output at a time
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# Scheduling priority of background runs, so they yield to the learner's own
+SPECULATIVE_NICENESS = 10
+
+
+class _SpeculativeRun:
+    """A background run of an exercise the learner hasn't reached yet."""
+
+    def __init__(self, target: str, digest: str, tests: list[str] | None):
+        self.target = target
+        # content hash when the run started; any edit invalidates the result
+        self.digest = digest
+        self.tests = tests
+        self.task: asyncio.Task | None = None
+
 
 class Runner:
-    def __init__(self, exercises_path: Path, start_from: str | None = None):
+    def __init__(
+        self,
+        exercises_path: Path,
+        start_from: str | None = None,
+        threads: int | None = None,
+        show_timings: bool = False,
+        show_profile: bool = False,
+    ):
         self.current_index = 0
         self.exercises_path = exercises_path
         self.exercises = self._discover_exercises()
         self.total_exercises = len(self.exercises)
         self.progress_file = exercises_path / ".torchlings_progress"
+        # Threads per local run; None picks a share of the CPUs based on
+        # how many runs go at once (the learner's own plus one pre-run).
+        self.threads = threads
+        self.concurrent_runs = CONCURRENT_RUNS
+        self.show_timings = show_timings
+        self.show_profile = show_profile
+        # exercise path -> (fingerprints, results by test name) of its last run
+        self._last_runs: dict[str, tuple[dict[str, str], dict[str, TestResult]]] = {}
+        # exercise path -> background run of it, see _speculate
+        self._speculations: dict[str, _SpeculativeRun] = {}
+        # id of the latest run started by _work_on; never reset, so a "done"
+        # event left on the queue by an earlier exercise can't match
+        self._run_id = 0
+        # code -> whether it ran cleanly in the venv, see _venv_can_run
+        self._venv_checks: dict[str, bool] = {}
+        install_runtime(exercises_path)
         if start_from:
             self._start_from(start_from)
         else:
@@ -58,16 +149,33 @@ class Runner:
         )
 
     def _load_progress(self) -> None:
-        """Load the progress from the progress file."""
+        """Load the progress from the progress file.
+
+        Progress is kept as the current exercise's path, so it still points
+        at the same exercise after a new section is added. Older workspaces
+        saved an index, which is converted on load.
+        """
         if not self.progress_file.exists():
             self._save_progress()
         with open(self.progress_file, "r") as f:
-            self.current_index = int(f.read())
+            saved = f.read().strip()
+        if saved.lstrip("-").isdigit():
+            self.current_index = int(saved)
+            self._save_progress()
+            return
+        names = [self._progress_name(ex) for ex in self.exercises]
+        self.current_index = names.index(saved) if saved in names else 0
 
     def _save_progress(self) -> None:
         """Save the progress to the progress file."""
+        saved = str(self.current_index)
+        if 0 <= self.current_index < self.total_exercises:
+            saved = self._progress_name(self.exercises[self.current_index])
         with open(self.progress_file, "w") as f:
-            f.write(str(self.current_index))
+            f.write(saved)
+
+    def _progress_name(self, exercise: Path) -> str:
+        return exercise.relative_to(self.exercises_path).as_posix()
 
     def go_to_next_exercise(self):
         self.current_index += 1
@@ -80,7 +188,7 @@ class Runner:
         exercises = []
 
         for dir in self.exercises_path.iterdir():
-            if dir.is_dir():
+            if dir.is_dir() and not is_ignored(Path(dir.name)):
                 exercise_in_topic = []
                 for exercise in dir.iterdir():
                     if exercise.is_file() and exercise.suffix == ".py":
@@ -105,44 +213,310 @@ class Runner:
         return exercises
 
     def run(self):
+        try:
+            asyncio.run(self._run_async())
+        except KeyboardInterrupt:
+            # asyncio.run has already cancelled the tasks, which restored the
+            # terminal and killed any test runs; leave quietly, like "q"
+            click.echo()
+
+    async def _run_async(self):
+        """Work through the exercises, reacting to saves and keypresses.
+
+        File changes, keypresses and finished test runs all arrive as events
+        on one queue, so a key is handled immediately even while tests run.
+        """
+        self._print_progress()
+        click.echo(click.style("─" * 50, fg="white"))
+        events: asyncio.Queue = asyncio.Queue()
+        with self._keyboard(events):
+            while 0 <= self.current_index < self.total_exercises:
+                exercise = self.exercises[self.current_index]
+                click.echo()
+                click.echo(
+                    click.style(f"Working on {exercise}", fg="yellow", bold=True)
+                )
+                if self.current_index + 1 < self.total_exercises:
+                    self._speculate(self.exercises[self.current_index + 1])
+                if await self._work_on(exercise, events) == "q":
+                    break
+                self.go_to_next_exercise()
+                self._print_progress()
+        for speculation in self._speculations.values():
+            speculation.task.cancel()
+        if self.current_index == -1:
+            click.secho("\nAll exercises complete!", fg="green", bold=True)
+
+    async def _work_on(self, exercise: Path, events: asyncio.Queue) -> str:
+        """Run and rerun one exercise until it passes or the learner moves on.
+
+        Returns "n" to advance and "q" to quit.
+        """
+        target = str(exercise.resolve())
+        watcher = asyncio.create_task(self._watch_file(exercise, events))
+        run: asyncio.Task | None = None
+
+        def start_run():
+            nonlocal run
+            if run is not None:
+                run.cancel()
+            self._run_id += 1
+            run = asyncio.create_task(self._run_and_report(target, self._run_id, events))
+
+        start_run()
+        try:
+            while True:
+                kind, value = await events.get()
+                if kind == "done":
+                    finished_id, passed = value
+                    if finished_id == self._run_id:
+                        run = None
+                        if passed:
+                            return "n"
+                elif kind == "change" and value == target:
+                    start_run()
+                elif kind == "key":
+                    if value in ("n", "q"):
+                        return value
+                    if value == "t":
+                        # A manual rerun always runs the whole file
+                        self._last_runs.pop(target, None)
+                        click.echo()
+                        start_run()
+                    elif value == "h":
+                        self._print_help()
+                    elif value == "l":
+                        self._print_list()
+        finally:
+            watcher.cancel()
+            if run is not None:
+                run.cancel()
+                click.echo(click.style("Run cancelled", dim=True))
+
+    async def _run_and_report(
+        self, target: str, run_id: int, events: asyncio.Queue
+    ) -> None:
+        passed = await self.run_pytest(target)
+        events.put_nowait(("done", (run_id, passed)))
+
+    async def _watch_file(self, exercise_path: Path, events: asyncio.Queue) -> None:
+        target = exercise_path.resolve()
+        async for _ in awatch(target, debounce=1):
+            events.put_nowait(("change", str(target)))
+
+    @contextlib.contextmanager
+    def _keyboard(self, events: asyncio.Queue):
+        """Put single keypresses on the event queue while active.
+
+        The terminal is switched to cbreak mode so keys arrive without Enter.
+        Without a terminal on stdin the runner still works, just without keys.
+        """
+        if termios is None or not sys.stdin.isatty():
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+
+        def on_key():
+            data = os.read(fd, 32)
+            if not data:
+                loop.remove_reader(fd)
+                return
+            for key in data.decode(errors="ignore").lower():
+                if key in CONTROLS_DESCRIPTION:
+                    events.put_nowait(("key", key))
+
+        tty.setcbreak(fd)
+        loop.add_reader(fd, on_key)
+        click.echo(click.style("Press h for the list of keys", dim=True))
+        try:
+            yield
+        finally:
+            loop.remove_reader(fd)
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    def _print_progress(self) -> None:
+        done = self.total_exercises if self.current_index == -1 else self.current_index
         click.echo(
             click.style("Progress", fg="yellow", bold=True)
-            + f"  {self.current_index}/{self.total_exercises}"
+            + f"  {done}/{self.total_exercises}"
         )
-        click.echo(click.style("─" * 50, fg="white"))
 
-        while self.current_index < self.total_exercises:
-            click.echo()
+    def _print_help(self) -> None:
+        click.echo()
+        for key, description in CONTROLS_DESCRIPTION.items():
+            click.echo("  " + click.style(key, fg="cyan", bold=True) + f"  {description}")
+
+    def _print_list(self) -> None:
+        click.echo()
+        for i, exercise in enumerate(self.exercises):
+            relative = exercise.relative_to(self.exercises_path)
+            if i == self.current_index:
+                click.echo(click.style(f"  → {relative}", fg="yellow", bold=True))
+            elif i < self.current_index or self.current_index == -1:
+                click.echo(click.style(f"  ✓ {relative}", fg="green"))
+            else:
+                click.echo(click.style(f"  · {relative}", dim=True))
+
+    async def run_pytest(self, target: str | None = None) -> bool:
+        """Run pytest inside the venv. Returns True if tests succeed."""
+        if not target:
+            results = await self._dispatch(None, None, _echo_result)
+            passed = bool(results) and all(r.passed for r in results)
+            if passed:
+                click.echo(ALL_PASSED_MESSAGE)
+            return passed
+
+        # Untouched TODOs and syntax errors are reported straight from the
+        # AST; pytest only runs the tests that could actually pass.
+        check = precheck(target)
+        if check.syntax_error:
+            click.echo(format_failure_line("syntax error", check.syntax_error))
+            return False
+        for test_name, reason in check.doomed.items():
+            click.echo(format_failure_line(test_name, reason))
+        if not check.runnable:
+            return False
+
+        # Tests whose code didn't change since the last run keep their result
+        key = str(Path(target).resolve())
+        reused = {}
+        if key in self._last_runs:
+            previous_prints, previous_results = self._last_runs[key]
+            affected = changed_tests(previous_prints, check)
+            reused = {
+                t: previous_results[t]
+                for t in check.runnable
+                if t not in affected and t in previous_results
+            }
+        for result in reused.values():
             click.echo(
-                click.style(
-                    f"Working on {self.exercises[self.current_index]}",
-                    fg="yellow",
-                    bold=True,
-                )
+                format_result_line(result.name, result.passed, result.error)
+                + click.style(" (unchanged)", dim=True)
             )
-            result = self.run_pytest(str(self.exercises[self.current_index]))
-            if not result:
-                self.watch_file(self.exercises[self.current_index])
-            self.go_to_next_exercise()
-            click.echo(
-                click.style("Progress", fg="yellow", bold=True)
-                + f"  {self.current_index}/{self.total_exercises}"
+
+        results = dict(reused)
+        to_run = [t for t in check.runnable if t not in reused]
+        if to_run:
+            partial = check.doomed or reused
+            fresh = await self._run_tests(
+                target, to_run if partial else None, _echo_result
             )
+            if fresh is None:
+                return False
+            results.update((r.name, r) for r in fresh)
+        self._last_runs[key] = (check.fingerprints, results)
+
+        passed = not check.doomed and all(
+            t in results and results[t].passed for t in check.runnable
+        )
+        if passed and reused:
+            # Reused results are a shortcut while editing; completing the
+            # exercise always takes one run of the whole file.
+            click.echo(click.style("Confirming with a full run...", dim=True))
+            fresh = await self._dispatch(target, None, _echo_failure)
+            if fresh is None:
+                return False
+            results = {r.name: r for r in fresh}
+            self._last_runs[key] = (check.fingerprints, results)
+            passed = bool(fresh) and all(r.passed for r in fresh)
 
-    def watch_file(self, exercise_path: Path):
-        TARGET = exercise_path.resolve()
-        for _ in watch(TARGET, debounce=1):
-            result = self.run_pytest(str(TARGET))
-            if result:
-                break
+        if passed:
+            click.echo(ALL_PASSED_MESSAGE)
+        return passed
 
-    def run_pytest(self, target: str | None = None) -> bool:
-        """Run pytest inside the venv. Returns True if tests succeed."""
+    def _speculate(self, exercise: Path) -> None:
+        """Start running an upcoming exercise in the background.
+
+        Only exercises that run on the local backend are pre-run. The result
+        is used by the first real run of that file if its content and test
+        selection still match, and is thrown away otherwise. Pre-runs of
+        anything but this exercise and the current one are cancelled.
+        """
+        target = str(exercise.resolve())
+        current = str(self.exercises[self.current_index].resolve())
+        for stale in set(self._speculations) - {target, current}:
+            self._speculations.pop(stale).task.cancel()
+        if target in self._speculations:
+            return
+        # A pre-run isn't profiled, and reusing it would leave the profile out
+        if self.show_profile:
+            return
+        if is_gpu_exercise(target) and not self._has_cuda():
+            return
+        digest = file_digest(exercise)
+        check = precheck(target)
+        if check.syntax_error or not check.runnable:
+            return
+
+        speculation = _SpeculativeRun(
+            target, digest, check.runnable if check.doomed else None
+        )
+        # Compared with the reference like a foreground run, so reusing the
+        # result reports the same things
+        speculation.task = asyncio.create_task(
+            self._execute_locally(
+                target, tests=speculation.tests, background=True, compare=True
+            )
+        )
+        self._speculations[target] = speculation
+
+    async def _run_tests(
+        self, target: str, tests: list[str] | None, on_result
+    ) -> list[TestResult] | None:
+        """Like _dispatch, but take a matching speculative result if there is one."""
+        speculation = self._speculations.pop(str(Path(target).resolve()), None)
+        if speculation is None:
+            return await self._dispatch(target, tests, on_result)
+        if speculation.tests != tests or speculation.digest != file_digest(target):
+            speculation.task.cancel()
+            return await self._dispatch(target, tests, on_result)
+        try:
+            # shield: cancelling this run shouldn't throw the pre-run away
+            results, report = await asyncio.shield(speculation.task)
+        except asyncio.CancelledError:
+            if not speculation.task.cancelled():
+                self._speculations[speculation.target] = speculation
+            raise
+        except Exception:
+            return await self._dispatch(target, tests, on_result)
+        self._report_run(target, results, report, on_result)
+        return results
+
+    async def _dispatch(
+        self, target: str | None, tests: list[str] | None, on_result
+    ) -> list[TestResult] | None:
+        """Pick a backend for the target and run (a subset of) its tests.
+
+        `on_result` is called with every result as soon as it is known.
+        Returns None when no backend could run the exercise.
+        """
         if target and is_gpu_exercise(target) and not self._has_cuda():
+            if is_triton_exercise(target) and self._has_triton():
+                click.echo(
+                    click.style(
+                        "No CUDA device found, running Triton kernels on the CPU interpreter...",
+                        fg="cyan",
+                    )
+                )
+                return await self._run_pytest_locally(
+                    target,
+                    {"TRITON_INTERPRET": "1"},
+                    tests,
+                    on_result,
+                    backend="triton-interpreter",
+                )
+
             ok, reason = check_modal_available()
             if not ok:
                 if reason == "not_installed":
                     print_modal_setup_guide()
+                    if is_triton_exercise(target):
+                        click.echo(
+                            "Or run the kernels locally on Triton's CPU interpreter: "
+                            + click.style("uv pip install triton", fg="cyan", bold=True)
+                        )
                 else:
                     click.echo(
                         click.style(
@@ -151,115 +525,327 @@ class Runner:
                         )
                         + click.style("modal setup", fg="cyan", bold=True)
                     )
-                return False
-
-            return self._run_pytest_on_modal(target)
-
-        env = os.environ.copy()
-        env["VIRTUAL_ENV"] = VENV_NAME
-        env["PATH"] = str(Path(VENV_NAME) / "bin") + os.pathsep + env["PATH"]
+                return None
 
-        cmd = ["pytest", "-v", "--tb=short", "--no-header"]
+            stop = threading.Event()
+            try:
+                return await asyncio.to_thread(
+                    self._run_pytest_on_modal, target, tests, on_result, stop
+                )
+            except asyncio.CancelledError:
+                stop.set()
+                raise
+
+        return await self._run_pytest_locally(target, tests=tests, on_result=on_result)
+
+    async def _run_pytest_locally(
+        self,
+        target: str | None = None,
+        extra_env: dict[str, str] | None = None,
+        tests: list[str] | None = None,
+        on_result=None,
+        background: bool = False,
+        backend: str = "local",
+    ) -> list[TestResult]:
+        """Run pytest in the local venv, with optional extra environment.
+
+        With `tests`, only those test functions of the target are run.
+        Background runs get a lower CPU priority and report nothing. A full
+        foreground run of an exercise with a reference solution also
+        compares the learner's functions with it.
+        """
+        results, report = await self._execute_locally(
+            target, extra_env, tests, background, backend, compare=not background
+        )
+        self._report_run(target, results, report, on_result, background)
+        return results
+
+    async def _execute_locally(
+        self,
+        target: str | None = None,
+        extra_env: dict[str, str] | None = None,
+        tests: list[str] | None = None,
+        background: bool = False,
+        backend: str = "local",
+        compare: bool = False,
+    ) -> tuple[list[TestResult], dict]:
+        """Run pytest locally and record it, returning results and the plugin's report.
+
+        Cancelling the run kills pytest. With `compare`, a full run of an
+        exercise with a reference solution is timed against it.
+        """
+        report_fd, report_file = tempfile.mkstemp(
+            prefix="timings-", suffix=".json", dir=state_dir(self.exercises_path)
+        )
+        os.close(report_fd)
+        env = self._pytest_env(extra_env)
+        env.update(cpu_affinity_env(self.run_threads(), background))
+        env[REPORT_FILE_ENV] = report_file
+        reference = target and reference_file(self._exercise_name(target))
+        if reference and tests is None and compare:
+            env[REFERENCE_FILE_ENV] = str(reference)
+        if self.show_profile and not background:
+            env[PROFILE_ENV] = "1"
+        # Output is parsed as it arrives rather than collected first, so a
+        # test that prints megabytes doesn't have to fit in memory.
+        parser = TestOutputParser()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        parse_time = 0.0
+        try:
+            spawned = time.time()
+            process = await asyncio.create_subprocess_exec(
+                *self._pytest_command(target, tests),
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+            if background and hasattr(os, "setpriority"):
+                try:
+                    os.setpriority(os.PRIO_PROCESS, process.pid, SPECULATIVE_NICENESS)
+                except OSError:
+                    pass
+            try:
+                while chunk := await process.stdout.read(OUTPUT_CHUNK_SIZE):
+                    parse_start = time.perf_counter()
+                    parser.feed(decoder.decode(chunk))
+                    parse_time += time.perf_counter() - parse_start
+                await process.wait()
+            except asyncio.CancelledError:
+                with contextlib.suppress(ProcessLookupError):
+                    process.kill()
+                await process.wait()
+                raise
+            exited = time.time()
+            report = _read_report(report_file)
+        finally:
+            os.unlink(report_file)
+
+        parse_start = time.perf_counter()
+        parser.feed(decoder.decode(b"", final=True))
+        results = parser.results()
+        parse_time += time.perf_counter() - parse_start
+
+        phases = {}
+        if "started" in report and "finished" in report:
+            phases["spawn"] = report["started"] - spawned
+            for phase in ("torch_import", "collection", "tests", "benchmark"):
+                if phase in report:
+                    phases[phase] = report[phase]
+            phases["exit"] = exited - report["finished"]
+        phases["parse"] = parse_time
+        self._record_run(
+            target,
+            backend,
+            results,
+            phases,
+            exited - spawned + parse_time,
+            threads=self.run_threads(),
+            background=background,
+            reference=report.get("reference", {}),
+        )
+        return results, report
+
+    def _report_run(
+        self,
+        target: str | None,
+        results: list[TestResult],
+        report: dict,
+        on_result=None,
+        background: bool = False,
+    ) -> None:
+        """Show a local run's results and what the plugin reported with them."""
+        if on_result:
+            for r in results:
+                on_result(r)
+            for test, reason in report.get("inconclusive", {}).items():
+                click.echo(format_inconclusive(test, reason))
+        if background:
+            return
+        if report.get("profile"):
+            click.echo("\n".join(format_profile(report["profile"])))
+        if report.get("perf") and self.show_profile:
+            click.echo("\n".join(format_perf(report["perf"])))
+        if report.get("memory") and self.show_profile:
+            click.echo("\n".join(format_memory(report["memory"])))
+        if report.get("reference"):
+            self._report_reference(target, report["reference"])
+
+    def _report_reference(self, target: str, comparison: dict[str, dict]) -> None:
+        """Show how a passing solution compares and note any personal bests."""
+        click.echo("\n".join(format_reference(comparison)))
+        beaten = record_timings(
+            self.exercises_path, self._exercise_name(target), comparison
+        )
+        for name, previous in beaten.items():
+            click.echo(format_personal_best(name, comparison[name]["seconds"], previous))
+
+    def _pytest_command(
+        self, target: str | None = None, tests: list[str] | None = None
+    ) -> list[str]:
+        """Build the trimmed pytest command line for a local run."""
+        cmd = ["pytest", *PYTEST_ARGS, *pytest_profile_args(self.exercises_path)]
         if target:
-            cmd.append(target)
+            path = str(Path(target).resolve())
+            if tests is None:
+                cmd.append(path)
+            else:
+                cmd.extend(f"{path}::{test}" for test in tests)
+        return cmd
+
+    def run_threads(self) -> int:
+        """Thread count each local run is limited to."""
+        return self.threads or thread_budget(self.concurrent_runs)
+
+    def _pytest_env(self, extra_env: dict[str, str] | None = None) -> dict[str, str]:
+        """Build the environment for a local pytest run in the venv."""
+        env = os.environ.copy()
+        # The same interpreter _venv_can_run probes, wherever this was started
+        bin_dir = venv_python(self.exercises_path).parent
+        env["VIRTUAL_ENV"] = str(bin_dir.parent)
+        env["PATH"] = str(bin_dir) + os.pathsep + env["PATH"]
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env.update(compile_cache_env(self.exercises_path))
+        env.update(pytest_profile_env(self.exercises_path))
+        env.update(thread_env(self.run_threads()))
+        if extra_env:
+            env.update(extra_env)
+        return env
+
+    def _run_pytest_on_modal(
+        self,
+        target: str,
+        tests: list[str] | None = None,
+        on_result=None,
+        stop: threading.Event | None = None,
+    ) -> list[TestResult]:
+        """Run a GPU exercise on Modal, reporting results as they stream in.
+
+        Blocking; runs on a worker thread. Setting `stop` silences the run
+        and shuts Modal down when the next event arrives.
+        """
+        click.echo(click.style("Running on Modal GPU...", fg="cyan", bold=True))
 
-        result = subprocess.run(cmd, env=env, capture_output=True, text=True)
-        passed, message = format_test_output(result.stdout, result.stderr)
-        click.echo(message)
-        return passed
+        results = []
+        seen = set()
+        report = {}
+        started = time.perf_counter()
+        events = stream_modal_events(target, PYTEST_ARGS, tests)
+        with contextlib.closing(events):
+            for event in events:
+                if stop is not None and stop.is_set():
+                    break
+                kind = event.get("event")
+                if kind == "result":
+                    name = event.get("test", "")
+                    outcome = event.get("outcome")
+                    if name in seen or outcome not in ("passed", "failed"):
+                        continue
+                    seen.add(name)
+                    result = TestResult(name, outcome == "passed", event.get("error", ""))
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+                elif kind == "inconclusive" and on_result:
+                    click.echo(format_inconclusive(event["test"], event["reason"]))
+                elif kind == "perf" and on_result and self.show_profile:
+                    perf = {event["test"]: event["measurements"]}
+                    click.echo("\n".join(format_perf(perf)))
+                elif kind == "memory" and on_result and self.show_profile:
+                    memory = {event["test"]: event["usages"]}
+                    click.echo("\n".join(format_memory(memory)))
+                elif kind == "error":
+                    detail = event.get("error", "")
+                    first_line = detail.splitlines()[0] if detail else "failed"
+                    click.echo(
+                        "  " + click.style("collection", fg="red") + " -- " + first_line
+                    )
+                elif kind == "timings":
+                    report = event
+                elif kind == "done" and not seen and event.get("output"):
+                    click.echo(event["output"].rstrip())
+
+        if stop is None or not stop.is_set():
+            # Remote clocks can't be compared with ours, so everything
+            # outside the remote pytest phases is counted as Modal overhead.
+            total = time.perf_counter() - started
+            phases = {
+                phase: report[phase]
+                for phase in ("torch_import", "collection", "tests")
+                if phase in report
+            }
+            phases = {"modal": max(0.0, total - sum(phases.values())), **phases}
+            self._record_run(target, "modal", results, phases, total)
+        return results
+
+    def _record_run(
+        self,
+        target: str | None,
+        backend: str,
+        results: list[TestResult],
+        phases: dict[str, float],
+        total: float,
+        threads: int | None = None,
+        background: bool = False,
+        reference: dict[str, dict] | None = None,
+    ) -> None:
+        """Append a finished run to the history, and show its timings if asked."""
+        record = {
+            "time": round(time.time(), 3),
+            "exercise": self._exercise_name(target) if target else ".",
+            "backend": backend,
+            "background": background,
+            "threads": threads,
+            "tests": len(results),
+            "passed": bool(results) and all(r.passed for r in results),
+            "total": round(total, 4),
+            "phases": {name: round(t, 4) for name, t in phases.items()},
+        }
+        if reference:
+            record["reference"] = reference
+        append_history(self.exercises_path, record)
+        if self.show_timings and not background:
+            click.echo(format_timings(phases, total, threads))
+
+    def _exercise_name(self, target: str) -> str:
+        """Path of an exercise relative to the workspace, like "04_loss/1.py"."""
+        path = Path(target).resolve()
+        workspace = self.exercises_path.resolve()
+        return str(path.relative_to(workspace) if path.is_relative_to(workspace) else path)
+
+    def _has_triton(self) -> bool:
+        """Check if Triton is importable in the exercise venv."""
+        return self._venv_can_run("import triton")
 
-    def _run_pytest_on_modal(self, target: str) -> bool:
-        """Run a GPU exercise on Modal via the modal CLI."""
-        import base64
-        import subprocess as sp
-        import tempfile
+    def _has_cuda(self) -> bool:
+        """Check if CUDA is available in the exercise venv."""
+        return self._venv_can_run(
+            "import sys, torch; sys.exit(not torch.cuda.is_available())"
+        )
 
-        click.echo(click.style("Running on Modal GPU...", fg="cyan", bold=True))
+    def _venv_can_run(self, code: str) -> bool:
+        """Check that `code` exits cleanly in the exercise venv, once per runner."""
+        if code not in self._venv_checks:
+            result = subprocess.run(
+                [str(venv_python(self.exercises_path)), "-c", code],
+                capture_output=True,
+            )
+            self._venv_checks[code] = result.returncode == 0
+        return self._venv_checks[code]
 
-        with open(target) as f:
-            exercise_b64 = base64.b64encode(f.read().encode()).decode()
 
-        script = f'''import modal
-import base64, tempfile, subprocess, os
+def _echo_result(result: TestResult) -> None:
+    click.echo(format_result_line(result.name, result.passed, result.error))
 
-app = modal.App("torchlings")
-image = modal.Image.debian_slim(python_version="3.12").pip_install(
-    "torch", "pytest", "numpy", "triton"
-)
 
-EXERCISE_B64 = "{exercise_b64}"
-DELIM = "===TORCHLINGS_OUTPUT==="
-
-@app.function(gpu="T4", image=image, timeout=180)
-def run_exercise():
-    content = base64.b64decode(EXERCISE_B64).decode("utf-8")
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False, dir="/tmp") as f:
-        f.write(content)
-        path = f.name
-    result = subprocess.run(
-        ["python", "-m", "pytest", path, "-v", "--tb=short", "--no-header"],
-        capture_output=True, text=True,
-    )
-    os.unlink(path)
-    return result.stdout, result.returncode
-
-@app.local_entrypoint()
-def main():
-    stdout, code = run_exercise.remote()
-    print(DELIM)
-    print(stdout)
-    print("RC=" + str(code))
-    print(DELIM)
-'''
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".py", delete=False, prefix="torchlings_modal_"
-        ) as f:
-            f.write(script)
-            script_path = f.name
+def _echo_failure(result: TestResult) -> None:
+    if not result.passed:
+        _echo_result(result)
 
-        try:
-            result = sp.run(
-                ["modal", "run", script_path],
-                capture_output=True,
-                text=True,
-            )
-            # Extract pytest output between delimiters, ignore Modal noise
-            stdout = result.stdout
-            delim = "===TORCHLINGS_OUTPUT==="
-            pytest_output = ""
-            returncode = 1
-
-            if delim in stdout:
-                parts = stdout.split(delim)
-                if len(parts) >= 2:
-                    payload = parts[1]
-                    for line in payload.splitlines():
-                        if line.startswith("RC="):
-                            returncode = int(line[3:].strip())
-                        else:
-                            pytest_output += line + "\n"
-
-            passed, message = format_test_output(pytest_output, "")
-            click.echo(message)
-            return passed
-        finally:
-            os.unlink(script_path)
 
-    def _has_cuda(self) -> bool:
-        """Check if CUDA is available in the exercise venv."""
-        if hasattr(self, "_cuda_available"):
-            return self._cuda_available
-        import subprocess
-        import sys
-
-        venv_python = Path(VENV_NAME) / "bin" / "python"
-        if not venv_python.exists():
-            venv_python = Path(sys.executable)
-        result = subprocess.run(
-            [str(venv_python), "-c", "import torch; print(torch.cuda.is_available())"],
-            capture_output=True,
-            text=True,
-        )
-        self._cuda_available = result.stdout.strip() == "True"
-        return self._cuda_available
+def _read_report(path: str) -> dict:
+    """Timings the pytest plugin wrote, or nothing if it never got that far."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
@@ -0,0 +1,29 @@
+"""Modules that run inside the exercise interpreter rather than the CLI.
+
+The exercise venv (and the Modal image) only has torch, pytest and numpy,
+so these modules stick to the standard library, pytest and torch and are
+shipped next to the exercise as a tiny ``torchlings`` package.
+"""
+
+from pathlib import Path
+
+RUNTIME_MODULES = ("__init__.py", "pytest_plugin.py", "testing.py")
+PYTEST_PLUGIN = "torchlings.pytest_plugin"
+
+
+def read_runtime_sources() -> dict[str, str]:
+    """Return {filename: source} for every runtime module."""
+    package_dir = Path(__file__).parent
+    return {name: (package_dir / name).read_text() for name in RUNTIME_MODULES}
+
+
+def reference_file(exercise: str) -> Path | None:
+    """Hidden reference solution of an exercise like "04_loss/1.py", if any.
+
+    References ship inside the torchlings package and are never copied into
+    the workspace; runs read them from here.
+    """
+    if Path(exercise).is_absolute():
+        return None  # outside the workspace, so not one of ours
+    path = Path(__file__).parent / "references" / exercise
+    return path if path.is_file() else None
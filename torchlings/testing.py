@@ -0,0 +1,683 @@
+"""Assertions for exercise tests.
+
+A failing ``assert torch.allclose(a, b)`` makes pytest print both tensors in
+full, which for a big tensor is megabytes of output nobody reads. These
+helpers summarise the mismatch instead and never build a tensor's repr.
+
+Performance budgets check that a solution which is already correct is also
+fast and lean enough, so a Python loop over elements doesn't pass where a
+vectorized expression is expected. FLOP counts check the work a model does
+regardless of how fast the machine is, like a depthwise-separable block
+doing less than the standard convolution it replaces. track_memory measures
+what a block of code allocates on the CPU, where torch keeps no statistics.
+"""
+
+import contextlib
+import math
+import time
+import weakref
+from collections import Counter
+from dataclasses import dataclass
+from itertools import zip_longest
+
+import torch
+from torch.utils._python_dispatch import TorchDispatchMode, _disable_current_modes
+from torch.utils._pytree import tree_leaves
+
+# How many differing elements a failure lists
+MAX_REPORTED = 3
+
+# Each timed trial repeats the call until it lasts about this long, so fast
+# functions aren't lost in timer resolution
+MIN_TRIAL_SECONDS = 1e-3
+
+# Timing stops early once the 95% confidence interval of the mean is within
+# this fraction of it. It never stops before MIN_TRIALS trials, even past
+# max_time: with fewer the interval is too wide to judge anything by.
+TARGET_PRECISION = 0.05
+MIN_TRIALS = 3
+
+# A confidence interval wider than this fraction of the mean means the
+# machine was too busy to judge a time budget
+MAX_NOISE = 0.25
+
+# Student's t for a 95% interval, by degrees of freedom 1-9; 2.0 beyond
+_T95 = (12.71, 4.30, 3.18, 2.78, 2.57, 2.45, 2.36, 2.31, 2.26)
+
+
+def assert_close(
+    actual,
+    expected,
+    *,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    equal_nan: bool = False,
+    msg: str | None = None,
+) -> None:
+    """``assert torch.allclose(actual, expected)`` with a compact report.
+
+    Tolerances and broadcasting follow torch.allclose. A failure names the
+    shape or dtype mismatch, or how many elements differ, the largest
+    absolute and relative error and the first few differing indices.
+    """
+    prefix = f"{msg}: " if msg else ""
+    if not isinstance(expected, torch.Tensor):
+        expected = torch.as_tensor(expected)
+    if not isinstance(actual, torch.Tensor):
+        raise AssertionError(
+            f"{prefix}got {type(actual).__name__}, expected a tensor of shape "
+            f"{expected.shape}"
+        )
+
+    shape = _broadcast_shape(actual.shape, expected.shape)
+    if shape is None:
+        raise AssertionError(
+            f"{prefix}shape {actual.shape} does not match expected {expected.shape}"
+        )
+    if actual.dtype != expected.dtype:
+        raise AssertionError(
+            f"{prefix}dtype {actual.dtype} does not match expected {expected.dtype}"
+        )
+    if actual.device != expected.device:
+        raise AssertionError(
+            f"{prefix}tensor is on {actual.device}, expected {expected.device}"
+        )
+
+    actual = actual.detach().broadcast_to(shape)
+    expected = expected.detach().broadcast_to(shape)
+    close = torch.isclose(actual, expected, rtol=rtol, atol=atol, equal_nan=equal_nan)
+    if bool(close.all()):
+        return
+    raise AssertionError(prefix + _describe_mismatch(actual, expected, ~close))
+
+
+def _broadcast_shape(a: torch.Size, b: torch.Size) -> torch.Size | None:
+    """The shape a and b broadcast to, or None if they don't broadcast.
+
+    torch.broadcast_shapes would do, but its first call imports sympy,
+    which takes longer than the rest of a typical test run.
+    """
+    shape = []
+    for x, y in zip_longest(reversed(a), reversed(b), fillvalue=1):
+        if x != y and 1 not in (x, y):
+            return None
+        shape.append(y if x == 1 else x)
+    return torch.Size(reversed(shape))
+
+
+def _describe_mismatch(
+    actual: torch.Tensor, expected: torch.Tensor, mismatched: torch.Tensor
+) -> str:
+    count = int(mismatched.sum())
+    total = mismatched.numel()
+    a = actual[mismatched].double()
+    e = expected[mismatched].double()
+    abs_err = (a - e).abs()
+    nonzero = e != 0
+    rel_err = abs_err[nonzero] / e[nonzero].abs()
+
+    parts = [f"{count} of {total} elements differ"]
+    if abs_err.numel() and not abs_err.isnan().all():
+        parts.append(f"max abs error {abs_err.nan_to_num(nan=0.0).max().item():.4g}")
+    if rel_err.numel() and not rel_err.isnan().all():
+        parts.append(f"max rel error {rel_err.nan_to_num(nan=0.0).max().item():.4g}")
+
+    first = []
+    flat_indices = mismatched.reshape(-1).nonzero()[:MAX_REPORTED, 0].tolist()
+    for flat in flat_indices:
+        index = _unravel(flat, mismatched.shape)
+        got = actual[index].item() if index else actual.item()
+        want = expected[index].item() if index else expected.item()
+        where = f"at {list(index)}" if index else "value"
+        first.append(f"{where} got {_short(got)}, expected {_short(want)}")
+    return "; ".join([", ".join(parts), *first])
+
+
+def _unravel(flat: int, shape: torch.Size) -> tuple[int, ...]:
+    index = []
+    for size in reversed(shape):
+        flat, i = divmod(flat, size)
+        index.append(i)
+    return tuple(reversed(index))
+
+
+def _short(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+@dataclass
+class Measurement:
+    """How fast (and how memory hungry) a function was."""
+
+    # per call, in the fastest trial
+    seconds: float
+    trials: int
+    calls_per_trial: int
+    budget_seconds: float | None = None
+    peak_bytes: int | None = None
+    budget_bytes: int | None = None
+    # per call over all trials, with the half-width of its 95% confidence
+    # interval; 0 after a single trial
+    mean_seconds: float = 0.0
+    margin_seconds: float = 0.0
+
+    @property
+    def relative_margin(self) -> float:
+        """Half-width of the confidence interval as a fraction of the mean."""
+        return self.margin_seconds / self.mean_seconds if self.mean_seconds else 0.0
+
+    @property
+    def noisy(self) -> bool:
+        """Whether the trials disagreed too much to trust the timing."""
+        return self.relative_margin > MAX_NOISE
+
+
+class BudgetExceeded(AssertionError):
+    """A correct solution that is slower or bigger than its budget."""
+
+    def __init__(self, message: str, measurement: "Measurement | OpCount | Scaling"):
+        super().__init__(message)
+        self.measurement = measurement
+
+
+class Inconclusive(Exception):
+    """A time budget that looked exceeded while the timings were too noisy.
+
+    The torchlings pytest plugin reports the test as passed, with a note,
+    rather than failing a solution because something else used the CPU.
+    """
+
+    def __init__(self, message: str, measurement: "Measurement | Scaling"):
+        super().__init__(message)
+        self.measurement = measurement
+
+
+def measure(
+    fn, *args, warmup: int = 1, max_trials: int = 10, max_time: float = 0.25
+) -> Measurement:
+    """Time ``fn(*args)``: warmup calls, then up to `max_trials` timed trials.
+
+    Trials stop once the mean is known to TARGET_PRECISION, or once
+    `max_time` seconds were spent timing, so a slow solution gets only
+    MIN_TRIALS trials instead of holding up the run. The fastest trial is reported,
+    being the one least disturbed by everything else running on the
+    machine; the spread of the others tells whether the machine was quiet.
+    Timing runs outside any dispatch mode, so a test profiled with
+    ``--profile`` is timed at full speed and its op counts don't include
+    the timing loop.
+    """
+    with _disable_current_modes():
+        return _measure(fn, args, warmup, max_trials, max_time)
+
+
+def _measure(fn, args, warmup: int, max_trials: int, max_time: float) -> Measurement:
+    for _ in range(warmup):
+        fn(*args)
+    # Sized from a warm call; the first one pays for lazy initialisation
+    start = time.perf_counter()
+    fn(*args)
+    per_call = time.perf_counter() - start
+    calls = max(1, int(MIN_TRIAL_SECONDS / per_call)) if per_call > 0 else 1000
+
+    samples = []
+    spent = 0.0
+    while len(samples) < max_trials:
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn(*args)
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed / calls)
+        spent += elapsed
+        mean, margin = _confidence_interval(samples)
+        if len(samples) >= MIN_TRIALS and (
+            spent >= max_time or margin <= TARGET_PRECISION * mean
+        ):
+            break
+    return Measurement(
+        seconds=min(samples),
+        trials=len(samples),
+        calls_per_trial=calls,
+        mean_seconds=mean,
+        margin_seconds=margin,
+    )
+
+
+def _confidence_interval(samples: list[float]) -> tuple[float, float]:
+    """Mean of the samples and the half-width of its 95% confidence interval."""
+    n = len(samples)
+    mean = sum(samples) / n
+    if n < 2:
+        return mean, 0.0
+    variance = sum((x - mean) ** 2 for x in samples) / (n - 1)
+    t = _T95[n - 2] if n - 2 < len(_T95) else 2.0
+    return mean, t * math.sqrt(variance / n)
+
+
+@dataclass
+class OpCount:
+    """The aten ops a function dispatched and the memory they allocated."""
+
+    # op name (e.g. "add", "select") -> number of calls
+    ops: dict[str, int]
+    allocated_bytes: int
+    peak_bytes: int
+    # bytes of every tensor read or written by an op that isn't a view, an
+    # estimate of the memory traffic
+    bytes_moved: int = 0
+    # floating point operations of matmuls, convolutions and attention, as
+    # counted by torch.utils.flop_counter; only filled in by count_flops
+    flops: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.ops.values())
+
+
+class _OpTracer(TorchDispatchMode):
+    """Count the ops run under the mode and follow the storage they allocate.
+
+    With `flops`, FLOPs are added up with torch.utils.flop_counter's
+    formulas. FlopCounterMode itself isn't used: its first use imports
+    torch._dynamo and sympy, about a second for every test run.
+    """
+
+    def __init__(self, flops: bool = False):
+        super().__init__()
+        self.ops: Counter[str] = Counter()
+        self.allocated = 0
+        self.live = 0
+        self.peak = 0
+        self.bytes_moved = 0
+        self.flops = 0
+        self._tracked: set[int] = set()
+        self._flop_registry = {}
+        if flops:
+            from torch.utils.flop_counter import flop_registry
+
+            self._flop_registry = flop_registry
+
+    @classmethod
+    def _should_skip_dynamo(cls) -> bool:
+        # Otherwise torch wraps __torch_dispatch__ to keep torch.compile out,
+        # which imports torch._dynamo on first use: over a second, for a
+        # mode that is never compiled.
+        return False
+
+    def __torch_dispatch__(self, func, types, args=(), kwargs=None):
+        kwargs = kwargs or {}
+        self.ops[func.overloadpacket.__name__] += 1
+        out = func(*args, **kwargs)
+        if func.overloadpacket in self._flop_registry:
+            self.flops += self._flop_registry[func.overloadpacket](
+                *args, **kwargs, out_val=out
+            )
+        if not func.is_view:
+            self.bytes_moved += sum(
+                t.numel() * t.element_size()
+                for t in tree_leaves((args, kwargs, out))
+                if isinstance(t, torch.Tensor)
+            )
+        inputs = None
+        for tensor in tree_leaves(out):
+            if not isinstance(tensor, torch.Tensor):
+                continue
+            try:
+                storage = tensor.untyped_storage()
+            except (NotImplementedError, RuntimeError):
+                continue  # sparse and other storage-less tensors
+            if id(storage) in self._tracked or storage.nbytes() == 0:
+                continue
+            if inputs is None:
+                inputs = {
+                    t.untyped_storage().data_ptr()
+                    for t in tree_leaves((args, kwargs))
+                    if isinstance(t, torch.Tensor) and t.layout == torch.strided
+                }
+            if storage.data_ptr() in inputs:
+                continue  # a view of, or in-place op on, existing memory
+            self._tracked.add(id(storage))
+            self.allocated += storage.nbytes()
+            self.live += storage.nbytes()
+            self.peak = max(self.peak, self.live)
+            weakref.finalize(storage, self._free, id(storage), storage.nbytes())
+        return out
+
+    def _free(self, key: int, nbytes: int) -> None:
+        self._tracked.discard(key)
+        self.live -= nbytes
+
+    def result(self) -> OpCount:
+        return OpCount(
+            dict(self.ops), self.allocated, self.peak, self.bytes_moved, self.flops
+        )
+
+
+def count_ops(fn, *args) -> OpCount:
+    """Trace ``fn(*args)`` through the aten ops it dispatches.
+
+    Every torch call on a tensor, including indexing and ``.item()``, is at
+    least one op, so a Python loop over elements shows up as an op count
+    that grows with the input. Memory is counted from the same ops, which
+    works the same on CPU and GPU and ignores memory that existed before.
+    Like timing, counting is left out of a ``--profile`` of the test.
+    """
+    with _disable_current_modes(), _OpTracer() as tracer:
+        fn(*args)
+    return tracer.result()
+
+
+def count_flops(fn, *args) -> OpCount:
+    """count_ops, also adding up the FLOPs of ``fn(*args)``.
+
+    FLOPs depend only on shapes, so unlike timings they are the same on
+    every machine. Only matmuls, convolutions and attention are counted;
+    elementwise ops and reductions count as zero.
+    """
+    with _disable_current_modes(), _OpTracer(flops=True) as tracer:
+        fn(*args)
+    return tracer.result()
+
+
+def peak_memory(fn, *args) -> int:
+    """Most bytes of tensor storage ``fn(*args)`` had allocated at once."""
+    return count_ops(fn, *args).peak_bytes
+
+
+def assert_max_ops(
+    fn, *args, max_ops: int, max_bytes: int | None = None
+) -> OpCount:
+    """Fail a correct ``fn(*args)`` that runs too many ops or allocates too much.
+
+    Call it after the correctness checks; the failure says "correct but"
+    and names the ops that were run most often.
+    """
+    count = count_ops(fn, *args)
+    problems = []
+    if count.total > max_ops:
+        common = ", ".join(
+            f"{name} ×{n}" for name, n in Counter(count.ops).most_common(3)
+        )
+        problems.append(f"{count.total} ops, expected ≤ {max_ops} (mostly {common})")
+    if max_bytes is not None and count.allocated_bytes > max_bytes:
+        problems.append(
+            f"allocates {_format_bytes(count.allocated_bytes)},"
+            f" expected ≤ {_format_bytes(max_bytes)}"
+        )
+    if problems:
+        raise BudgetExceeded("correct but " + " and ".join(problems), count)
+    return count
+
+
+def assert_max_flops(
+    fn,
+    *args,
+    flops: int | None = None,
+    baseline=None,
+    max_ratio: float = 1.0,
+) -> OpCount:
+    """Fail a correct ``fn(*args)`` that does more floating point work than allowed.
+
+    The budget is either `flops`, or `max_ratio` times what
+    ``baseline(*args)`` does, e.g. the standard layer a cheaper block
+    replaces. Call it after the correctness checks; the failure says
+    "correct but".
+    """
+    count = count_flops(fn, *args)
+    budget = flops
+    if baseline is not None:
+        budget = count_flops(baseline, *args).flops * max_ratio
+    if budget is not None and count.flops > budget:
+        raise BudgetExceeded(
+            f"correct but {_format_flops(count.flops)},"
+            f" {_ratio(count.flops / max(1, budget))} the budget of"
+            f" {_format_flops(budget)}",
+            count,
+        )
+    return count
+
+
+@dataclass
+class MemoryUsage:
+    """Memory a block of code used on the CPU."""
+
+    # bytes of tensor storage the block allocated, and the most alive at once
+    allocated_bytes: int = 0
+    peak_bytes: int = 0
+    # how far the process's peak resident memory rose during the block;
+    # None where the OS can't reset the peak
+    rss_peak_bytes: int | None = None
+
+
+@contextlib.contextmanager
+def track_memory():
+    """Measure the memory used by the ``with`` block.
+
+    Tensor bytes come from the ops the block dispatches, so they are exact
+    and ignore tensors that existed before. The resident memory also covers
+    the allocator and everything outside torch, which makes it noisy for
+    small blocks; it is only measured on Linux.
+    """
+    usage = MemoryUsage()
+    start = _reset_peak_rss()
+    with _OpTracer() as tracer:
+        try:
+            yield usage
+        finally:
+            usage.allocated_bytes = tracer.allocated
+            usage.peak_bytes = tracer.peak
+            end = _peak_rss() if start is not None else None
+            if end is not None:
+                usage.rss_peak_bytes = max(0, end - start)
+
+
+def _reset_peak_rss() -> int | None:
+    """Lower the process's peak resident memory to the current, and return it."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return None
+    return _peak_rss()
+
+
+def _peak_rss() -> int | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def assert_max_memory(
+    usage: MemoryUsage,
+    *,
+    peak_bytes: int | None = None,
+    allocated_bytes: int | None = None,
+) -> MemoryUsage:
+    """Fail when a block measured with track_memory used too much memory.
+
+    Call it after the correctness checks; the failure says "correct but"
+    and adds how much the process's resident memory grew.
+    """
+    problems = []
+    if peak_bytes is not None and usage.peak_bytes > peak_bytes:
+        problems.append(
+            f"peaks at {_format_bytes(usage.peak_bytes)} of tensors,"
+            f" expected ≤ {_format_bytes(peak_bytes)}"
+        )
+    if allocated_bytes is not None and usage.allocated_bytes > allocated_bytes:
+        problems.append(
+            f"allocates {_format_bytes(usage.allocated_bytes)},"
+            f" expected ≤ {_format_bytes(allocated_bytes)}"
+        )
+    if problems:
+        message = "correct but " + " and ".join(problems)
+        if usage.rss_peak_bytes is not None:
+            message += f" (resident memory grew {_format_bytes(usage.rss_peak_bytes)})"
+        raise BudgetExceeded(message, usage)
+    return usage
+
+
+def assert_within_budget(
+    fn,
+    *args,
+    seconds: float | None = None,
+    baseline=None,
+    max_slowdown: float = 1.0,
+    peak_bytes: int | None = None,
+    warmup: int = 1,
+    max_trials: int = 10,
+) -> Measurement:
+    """Fail a correct but slow or memory hungry ``fn(*args)``.
+
+    The time budget is either `seconds` per call, or `max_slowdown` times
+    what ``baseline(*args)`` takes on the same machine, which holds up
+    across hardware. `peak_bytes` caps the tensor memory allocated at once.
+    Call it after the correctness checks; the failure says "correct but".
+    A time budget missed while the timings were noisy raises Inconclusive.
+    """
+    measurement = measure(fn, *args, warmup=warmup, max_trials=max_trials)
+    timings = [measurement]
+    if baseline is not None:
+        reference = measure(baseline, *args, warmup=warmup, max_trials=max_trials)
+        measurement.budget_seconds = reference.seconds * max_slowdown
+        timings.append(reference)
+    elif seconds is not None:
+        measurement.budget_seconds = seconds
+    if peak_bytes is not None:
+        measurement.peak_bytes = peak_memory(fn, *args)
+        measurement.budget_bytes = peak_bytes
+
+    problems = []
+    slow = None
+    budget = measurement.budget_seconds
+    if budget is not None and measurement.seconds > budget:
+        slow = (
+            f"{_ratio(measurement.seconds / budget)} slower than budget"
+            f" ({_format_seconds(measurement.seconds)} per call,"
+            f" budget {_format_seconds(budget)})"
+        )
+        problems.append(slow)
+    if peak_bytes is not None and measurement.peak_bytes > peak_bytes:
+        problems.append(
+            f"uses {_ratio(measurement.peak_bytes / max(1, peak_bytes))} the memory budget"
+            f" ({_format_bytes(measurement.peak_bytes)} peak,"
+            f" budget {_format_bytes(peak_bytes)})"
+        )
+    if slow and any(t.noisy for t in timings):
+        # Noise only excuses a miss when the budget lies within the timings'
+        # confidence intervals; a clear miss fails however busy the machine.
+        # The intervals are of the mean, so they are scaled to the fastest
+        # trial that is reported.
+        fastest = measurement.seconds * (1 - measurement.relative_margin)
+        if baseline is not None:
+            budget *= 1 + timings[-1].relative_margin
+        if fastest <= budget:
+            problems.remove(slow)
+            if not problems:
+                raise Inconclusive(f"{slow}, but {_noise(timings)}", measurement)
+    if problems:
+        raise BudgetExceeded("correct but " + " and ".join(problems), measurement)
+    return measurement
+
+
+@dataclass
+class Scaling:
+    """How a function's run time grew with the size of its input."""
+
+    sizes: list[int]
+    seconds: list[float]
+    # fitted k in time ~ size**k
+    exponent: float
+
+
+def fit_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """Least-squares slope of log(seconds) against log(size)."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def assert_scaling(
+    fn, make_args, sizes: list[int], *, max_exponent: float, tolerance: float = 0.4
+) -> Scaling:
+    """Fail a correct `fn` whose run time grows faster than size**max_exponent.
+
+    ``make_args(n)`` builds the argument tuple for size n. Fixed per-call
+    overhead flattens the curve at small sizes, so pick sizes where the
+    real work dominates; `tolerance` absorbs the remaining noise, and a
+    steep curve that noisy timings could still explain raises Inconclusive.
+    """
+    timings = [measure(fn, *make_args(n), max_time=0.1) for n in sizes]
+    seconds = [t.seconds for t in timings]
+    scaling = Scaling(list(sizes), seconds, fit_exponent(sizes, seconds))
+    if scaling.exponent > max_exponent + tolerance:
+        message = (
+            f"time grows like n^{scaling.exponent:.1f},"
+            f" expected at most n^{max_exponent:g}"
+            f" (n={sizes[0]}: {_format_seconds(seconds[0])},"
+            f" n={sizes[-1]}: {_format_seconds(seconds[-1])})"
+        )
+        if _flattest_exponent(sizes, timings) <= max_exponent + tolerance:
+            raise Inconclusive(f"{message}, but {_noise(timings)}", scaling)
+        raise BudgetExceeded("correct but " + message, scaling)
+    return scaling
+
+
+def _flattest_exponent(sizes: list[int], timings: list[Measurement]) -> float:
+    """The shallowest fit the timings' confidence intervals allow.
+
+    Timings at the small sizes move to the top of their intervals and
+    timings at the large sizes to the bottom, which flattens the curve as
+    far as the noise can explain.
+    """
+    middle = sum(math.log(n) for n in sizes) / len(sizes)
+    seconds = [
+        t.seconds * (1 + t.relative_margin) if math.log(n) < middle
+        else max(t.seconds * (1 - t.relative_margin), 1e-9)
+        for n, t in zip(sizes, timings)
+    ]
+    return fit_exponent(sizes, seconds)
+
+
+def _noise(timings: list[Measurement]) -> str:
+    """Why noisy timings can't be trusted, for an Inconclusive message."""
+    worst = max(t.relative_margin for t in timings)
+    return f"timings varied by ±{worst:.0%} on a busy machine"
+
+
+def _format_flops(flops: float) -> str:
+    """FLOPs with a metric prefix, like "9.4 MFLOPs"."""
+    for unit, scale in (("GFLOPs", 1e9), ("MFLOPs", 1e6), ("kFLOPs", 1e3)):
+        if flops >= scale:
+            return f"{flops / scale:.1f} {unit}"
+    return f"{flops:.0f} FLOPs"
+
+
+def _ratio(value: float) -> str:
+    return f"{value:.0f}×" if value >= 10 else f"{value:.1f}×"
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def _format_bytes(nbytes: float) -> str:
+    if nbytes < 1024:
+        return f"{nbytes} B"
+    for unit in ("KB", "MB", "GB"):
+        nbytes /= 1024
+        if nbytes < 1024 or unit == "GB":
+            return f"{nbytes:.1f} {unit}"
@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import List
 import click
+import hashlib
 import subprocess
 
 
@@ -23,6 +24,11 @@ def find_python_files(exercises_path: Path) -> List[Path]:
     ]
 
 
+def file_digest(path: Path) -> str:
+    """Content hash of a file, to tell whether it changed since it was run."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
 def _run(
     cmd: List[str],
     *,
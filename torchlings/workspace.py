@@ -0,0 +1,307 @@
+"""State torchlings keeps inside the exercises directory."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+import click
+from torchlings.runtime import PYTEST_PLUGIN, read_runtime_sources
+from torchlings.utils import _run, find_python_files
+from torchlings.venv import VENV_NAME
+
+STATE_DIR = ".torchlings"
+HISTORY_FILE = "history.jsonl"
+BESTS_FILE = "bests.json"
+
+# How much faster than the previous best a timing has to be to be called a
+# new personal best, so timer noise doesn't announce one on every rerun
+NEW_BEST_MARGIN = 0.05
+
+# Built-in plugins an exercise run never needs. Third-party plugins are
+# kept out entirely with PYTEST_DISABLE_PLUGIN_AUTOLOAD.
+PYTEST_BLOCKED_PLUGINS = (
+    "cacheprovider",
+    "doctest",
+    "junitxml",
+    "legacypath",
+    "logging",
+    "nose",
+    "pastebin",
+    "stepwise",
+    "unittest",
+    "warnings",
+)
+
+# An explicit config file stops pytest from searching parent directories for
+# one. Exercise files are passed by path, so they are collected without a
+# python_files pattern; a pattern like *.py would also make the assertion
+# rewriter rewrite every torch module imported during the run.
+PYTEST_INI = """[pytest]
+"""
+
+# Read by the pytest plugin, which applies them with torch.set_num_threads
+# and torch.set_num_interop_threads before any test runs.
+INTRA_OP_THREADS_ENV = "TORCHLINGS_INTRA_OP_THREADS"
+INTER_OP_THREADS_ENV = "TORCHLINGS_INTER_OP_THREADS"
+# Where the pytest plugin writes its phase timings
+REPORT_FILE_ENV = "TORCHLINGS_REPORT_FILE"
+# Reference solution the pytest plugin compares a passing exercise with
+REFERENCE_FILE_ENV = "TORCHLINGS_REFERENCE_FILE"
+# Set to have the pytest plugin count the FLOPs and bytes moved of each test
+PROFILE_ENV = "TORCHLINGS_PROFILE"
+# Comma-separated CPUs the pytest plugin pins the run to
+CPUS_ENV = "TORCHLINGS_CPUS"
+
+# Exercise tensors are tiny; past a few threads a run only pays for
+# spinning up and synchronising the pool.
+MAX_THREADS_PER_RUN = 4
+
+# Local runs going at once in ``torchlings run``: the learner's own plus
+# one pre-run of the next exercise
+CONCURRENT_RUNS = 2
+
+
+def state_dir(exercises_path: Path) -> Path:
+    """Return the absolute torchlings state directory of a workspace."""
+    return exercises_path.resolve() / STATE_DIR
+
+
+def append_history(exercises_path: Path, record: dict) -> None:
+    """Add one run to the workspace's run history, a JSON object per line."""
+    path = state_dir(exercises_path) / HISTORY_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def load_bests(exercises_path: Path) -> dict[str, dict[str, dict]]:
+    """Timings per exercise and function: current, best and reference."""
+    try:
+        return json.loads((state_dir(exercises_path) / BESTS_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def record_timings(
+    exercises_path: Path, exercise: str, comparison: dict[str, dict]
+) -> dict[str, float]:
+    """Store the latest timings of an exercise's functions, keeping the best.
+
+    `comparison` is the pytest plugin's comparison with the reference
+    solution. Returns the previous best of each function that just beat it.
+    """
+    bests = load_bests(exercises_path)
+    functions = bests.setdefault(exercise, {})
+    beaten = {}
+    for name, c in comparison.items():
+        entry = functions.get(name)
+        if entry is not None and c["seconds"] < entry["best"] * (1 - NEW_BEST_MARGIN):
+            beaten[name] = entry["best"]
+        functions[name] = {
+            "current": c["seconds"],
+            "best": min(c["seconds"], entry["best"]) if entry else c["seconds"],
+            "reference": c["reference_seconds"],
+        }
+    path = state_dir(exercises_path) / BESTS_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(bests, indent=1))
+    return beaten
+
+
+def venv_python(exercises_path: Path) -> Path:
+    """Return the workspace venv interpreter, or this one if there is none."""
+    python = exercises_path.resolve() / VENV_NAME / "bin" / "python"
+    if python.exists():
+        return python
+    return Path(sys.executable)
+
+
+def compile_cache_env(exercises_path: Path) -> dict[str, str]:
+    """Environment that keeps Inductor, FX-graph and Triton caches on disk.
+
+    Every run is a fresh process, so without this torch.compile starts from
+    an empty cache each time. Pointing the caches into the workspace lets
+    them survive across runs and sessions.
+    """
+    cache = state_dir(exercises_path) / "cache"
+    return {
+        "TORCHINDUCTOR_CACHE_DIR": str(cache / "inductor"),
+        "TORCHINDUCTOR_FX_GRAPH_CACHE": "1",
+        "TORCHINDUCTOR_AUTOGRAD_CACHE": "1",
+        "TRITON_CACHE_DIR": str(cache / "triton"),
+    }
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks and cgroups."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def thread_budget(concurrent_runs: int = 1) -> int:
+    """Threads per run so that `concurrent_runs` runs share the CPUs."""
+    return max(1, min(MAX_THREADS_PER_RUN, available_cpus() // max(1, concurrent_runs)))
+
+
+def thread_env(threads: int) -> dict[str, str]:
+    """Environment that pins every thread pool a run can start to `threads`.
+
+    OpenMP and the BLAS libraries size their pools from the environment at
+    load time. torch's inter-op pool has no variable of its own, so it is
+    set by the torchlings pytest plugin, as is the intra-op pool in case
+    torch ignored OMP_NUM_THREADS.
+    """
+    value = str(threads)
+    return {
+        "OMP_NUM_THREADS": value,
+        "MKL_NUM_THREADS": value,
+        "OPENBLAS_NUM_THREADS": value,
+        "TORCHINDUCTOR_COMPILE_THREADS": value,
+        INTRA_OP_THREADS_ENV: value,
+        # Exercises never run independent ops in parallel
+        INTER_OP_THREADS_ENV: "1",
+    }
+
+
+def cpu_affinity_env(threads: int, background: bool = False) -> dict[str, str]:
+    """Environment that pins a run to CPUs of its own.
+
+    The learner's runs get the first `threads` CPUs this process may use
+    and background runs the others, so a pre-run of the next exercise
+    doesn't disturb the timings of the current one. With no CPUs to spare,
+    runs aren't pinned.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return {}
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) <= threads:
+        return {}
+    pinned = cpus[threads:] if background else cpus[:threads]
+    return {CPUS_ENV: ",".join(map(str, pinned))}
+
+
+def runtime_lib_dir(exercises_path: Path) -> Path:
+    """Directory put on PYTHONPATH so runs can import the runtime modules."""
+    return state_dir(exercises_path) / "lib"
+
+
+def install_runtime(exercises_path: Path) -> None:
+    """Write the pytest config and runtime modules into the workspace.
+
+    Files are only rewritten when their content changed, so their bytecode
+    stays valid between runs.
+    """
+    files = {state_dir(exercises_path) / "pytest.ini": PYTEST_INI}
+    package_dir = runtime_lib_dir(exercises_path) / "torchlings"
+    for name, source in read_runtime_sources().items():
+        files[package_dir / name] = source
+
+    for path, content in files.items():
+        if path.exists() and path.read_text() == content:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def pytest_profile_args(exercises_path: Path) -> list[str]:
+    """pytest arguments for a trimmed, self-contained exercise run.
+
+    The ini file and rootdir are fixed so pytest doesn't search for config,
+    conftest lookup is skipped, and only the torchlings plugin is loaded.
+    """
+    args = [
+        "-c",
+        str(state_dir(exercises_path) / "pytest.ini"),
+        f"--rootdir={exercises_path.resolve()}",
+        "--noconftest",
+        "-p",
+        PYTEST_PLUGIN,
+    ]
+    for name in PYTEST_BLOCKED_PLUGINS:
+        args += ["-p", f"no:{name}"]
+    return args
+
+
+def pytest_profile_env(exercises_path: Path) -> dict[str, str]:
+    """Environment for a trimmed exercise run, see pytest_profile_args."""
+    pythonpath = str(runtime_lib_dir(exercises_path))
+    if os.environ.get("PYTHONPATH"):
+        pythonpath += os.pathsep + os.environ["PYTHONPATH"]
+    return {"PYTEST_DISABLE_PLUGIN_AUTOLOAD": "1", "PYTHONPATH": pythonpath}
+
+
+def warm_compile_cache(exercises_path: Path) -> None:
+    """Compile the 09_compile reference models once to fill the caches.
+
+    Compiled kernels are specialised on the thread count, so only runs with
+    the default one (no ``--threads``) find them in the cache.
+    """
+    env = os.environ.copy()
+    env.update(compile_cache_env(exercises_path))
+    env.update(thread_env(thread_budget(CONCURRENT_RUNS)))
+    script = Path(__file__).with_name("compile_warmup.py")
+
+    # Inductor logs its autotuning and compiler output as it goes, which is
+    # only worth showing when the warm-up fails
+    click.echo(click.style("$ warming torch.compile cache ", fg="blue"), err=True)
+    result = subprocess.run(
+        [str(venv_python(exercises_path)), str(script)],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        click.echo(
+            click.style("Warning: could not warm the torch.compile cache", fg="yellow"),
+            err=True,
+        )
+
+
+def precompile_workspace(exercises_path: Path) -> None:
+    """Byte-compile the runtime modules and warm pytest's assertion-rewrite cache.
+
+    Exercises aren't byte-compiled: pytest imports them through its rewrite
+    hook, which writes its own ``-pytest-X.pyc`` files instead. Both kinds
+    live in ``__pycache__`` and are keyed on the source mtime and size, so
+    later runs reuse them until a file changes.
+    """
+    python = str(venv_python(exercises_path))
+    env = os.environ.copy()
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.update(pytest_profile_env(exercises_path))
+
+    _run(
+        [python, "-m", "compileall", "-q", str(runtime_lib_dir(exercises_path))],
+        env=env,
+        display_name="$ precompiling runtime bytecode",
+    )
+
+    sources = [str(p) for p in sorted(find_python_files(exercises_path))]
+    if not sources:
+        return
+
+    # Collecting imports every exercise through pytest's rewrite hook, which
+    # writes the rewritten module to __pycache__. importlib mode avoids
+    # clashes between the many files that are all called 1.py, 2.py, ...
+    click.echo(click.style("$ warming pytest assertion-rewrite cache ", fg="blue"), err=True)
+    result = subprocess.run(
+        [
+            python, "-m", "pytest", "--collect-only", "-q",
+            "--import-mode=importlib",
+            *pytest_profile_args(exercises_path),
+            *sources,
+        ],
+        env=env,
+        cwd=exercises_path,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode not in (0, 5):
+        click.echo(
+            click.style(
+                "Warning: could not warm the assertion-rewrite cache", fg="yellow"
+            ),
+            err=True,
+        )